@@ -5,9 +5,122 @@ d = { 'settings': { 'branch': 'main',
                 'doc_host': 'https://Stocastico.github.io',
                 'git_url': 'https://github.com/Stocastico/xapi_analysis',
                 'lib_path': 'xapi_analysis'},
-  'syms': { 'xapi_analysis.core': {'xapi_analysis.core.foo': ('core.html#foo', 'xapi_analysis/core.py')},
+  'syms': { 'xapi_analysis.aggregate': { 'xapi_analysis.aggregate.InteractionAverages': ( 'aggregate.html#interactionaverages',
+                                                                                          'xapi_analysis/aggregate.py'),
+                                         'xapi_analysis.aggregate.InteractionAverages.__init__': ( 'aggregate.html#interactionaverages.__init__',
+                                                                                                   'xapi_analysis/aggregate.py'),
+                                         'xapi_analysis.aggregate.InteractionAverages.load': ( 'aggregate.html#interactionaverages.load',
+                                                                                               'xapi_analysis/aggregate.py'),
+                                         'xapi_analysis.aggregate.InteractionAverages.save': ( 'aggregate.html#interactionaverages.save',
+                                                                                               'xapi_analysis/aggregate.py'),
+                                         'xapi_analysis.aggregate.InteractionAverages.snapshot': ( 'aggregate.html#interactionaverages.snapshot',
+                                                                                                   'xapi_analysis/aggregate.py'),
+                                         'xapi_analysis.aggregate.InteractionAverages.update': ( 'aggregate.html#interactionaverages.update',
+                                                                                                 'xapi_analysis/aggregate.py'),
+                                         'xapi_analysis.aggregate.InteractionCounts': ( 'aggregate.html#interactioncounts',
+                                                                                        'xapi_analysis/aggregate.py'),
+                                         'xapi_analysis.aggregate.InteractionCounts.__init__': ( 'aggregate.html#interactioncounts.__init__',
+                                                                                                 'xapi_analysis/aggregate.py'),
+                                         'xapi_analysis.aggregate.InteractionCounts.load': ( 'aggregate.html#interactioncounts.load',
+                                                                                             'xapi_analysis/aggregate.py'),
+                                         'xapi_analysis.aggregate.InteractionCounts.save': ( 'aggregate.html#interactioncounts.save',
+                                                                                             'xapi_analysis/aggregate.py'),
+                                         'xapi_analysis.aggregate.InteractionCounts.snapshot': ( 'aggregate.html#interactioncounts.snapshot',
+                                                                                                 'xapi_analysis/aggregate.py'),
+                                         'xapi_analysis.aggregate.InteractionCounts.update': ( 'aggregate.html#interactioncounts.update',
+                                                                                               'xapi_analysis/aggregate.py')},
+            'xapi_analysis.benchmark': { 'xapi_analysis.benchmark._fresh': ('benchmark.html#_fresh', 'xapi_analysis/benchmark.py'),
+                                         'xapi_analysis.benchmark._measure': ('benchmark.html#_measure', 'xapi_analysis/benchmark.py'),
+                                         'xapi_analysis.benchmark.benchmark_cli': ( 'benchmark.html#benchmark_cli',
+                                                                                    'xapi_analysis/benchmark.py'),
+                                         'xapi_analysis.benchmark.benchmark_data': ( 'benchmark.html#benchmark_data',
+                                                                                     'xapi_analysis/benchmark.py'),
+                                         'xapi_analysis.benchmark.compare_to_baseline': ( 'benchmark.html#compare_to_baseline',
+                                                                                          'xapi_analysis/benchmark.py'),
+                                         'xapi_analysis.benchmark.load_baseline': ( 'benchmark.html#load_baseline',
+                                                                                    'xapi_analysis/benchmark.py'),
+                                         'xapi_analysis.benchmark.run_benchmarks': ( 'benchmark.html#run_benchmarks',
+                                                                                     'xapi_analysis/benchmark.py'),
+                                         'xapi_analysis.benchmark.save_baseline': ( 'benchmark.html#save_baseline',
+                                                                                    'xapi_analysis/benchmark.py')},
+            'xapi_analysis.cache': { 'xapi_analysis.cache._json_attrs': ('cache.html#_json_attrs', 'xapi_analysis/cache.py'),
+                                     'xapi_analysis.cache._source_prefix': ('cache.html#_source_prefix', 'xapi_analysis/cache.py'),
+                                     'xapi_analysis.cache.cache_key': ('cache.html#cache_key', 'xapi_analysis/cache.py'),
+                                     'xapi_analysis.cache.cache_size': ('cache.html#cache_size', 'xapi_analysis/cache.py'),
+                                     'xapi_analysis.cache.cached_import_csv': ('cache.html#cached_import_csv', 'xapi_analysis/cache.py'),
+                                     'xapi_analysis.cache.evict_cache': ('cache.html#evict_cache', 'xapi_analysis/cache.py'),
+                                     'xapi_analysis.cache.invalidate_cache': ('cache.html#invalidate_cache', 'xapi_analysis/cache.py')},
+            'xapi_analysis.core': {'xapi_analysis.core.foo': ('core.html#foo', 'xapi_analysis/core.py')},
+            'xapi_analysis.dedup': { 'xapi_analysis.dedup.BloomFilter': ('dedup.html#bloomfilter', 'xapi_analysis/dedup.py'),
+                                     'xapi_analysis.dedup.BloomFilter.__init__': ( 'dedup.html#bloomfilter.__init__',
+                                                                                   'xapi_analysis/dedup.py'),
+                                     'xapi_analysis.dedup.BloomFilter._positions': ( 'dedup.html#bloomfilter._positions',
+                                                                                     'xapi_analysis/dedup.py'),
+                                     'xapi_analysis.dedup.BloomFilter.add': ('dedup.html#bloomfilter.add', 'xapi_analysis/dedup.py'),
+                                     'xapi_analysis.dedup.BloomFilter.contains': ( 'dedup.html#bloomfilter.contains',
+                                                                                   'xapi_analysis/dedup.py'),
+                                     'xapi_analysis.dedup.StatementDeduplicator': ( 'dedup.html#statementdeduplicator',
+                                                                                    'xapi_analysis/dedup.py'),
+                                     'xapi_analysis.dedup.StatementDeduplicator.__call__': ( 'dedup.html#statementdeduplicator.__call__',
+                                                                                             'xapi_analysis/dedup.py'),
+                                     'xapi_analysis.dedup.StatementDeduplicator.__init__': ( 'dedup.html#statementdeduplicator.__init__',
+                                                                                             'xapi_analysis/dedup.py'),
+                                     'xapi_analysis.dedup.StatementDeduplicator.filter': ( 'dedup.html#statementdeduplicator.filter',
+                                                                                           'xapi_analysis/dedup.py'),
+                                     'xapi_analysis.dedup._statement_hashes': ('dedup.html#_statement_hashes', 'xapi_analysis/dedup.py'),
+                                     'xapi_analysis.dedup.drop_duplicate_statements': ( 'dedup.html#drop_duplicate_statements',
+                                                                                        'xapi_analysis/dedup.py'),
+                                     'xapi_analysis.dedup.statement_key': ('dedup.html#statement_key', 'xapi_analysis/dedup.py')},
+            'xapi_analysis.ingest': { 'xapi_analysis.ingest._import_sniffed': ('ingest.html#_import_sniffed', 'xapi_analysis/ingest.py'),
+                                      'xapi_analysis.ingest.expand_paths': ('ingest.html#expand_paths', 'xapi_analysis/ingest.py'),
+                                      'xapi_analysis.ingest.import_csv_files': ('ingest.html#import_csv_files', 'xapi_analysis/ingest.py'),
+                                      'xapi_analysis.ingest.sniff_csv': ('ingest.html#sniff_csv', 'xapi_analysis/ingest.py')},
             'xapi_analysis.input': {'xapi_analysis.input.foo': ('input.html#foo', 'xapi_analysis/input.py')},
-            'xapi_analysis.input_csv': { 'xapi_analysis.input_csv.average_interactions': ( 'input_csv.html#average_interactions',
+            'xapi_analysis.input_csv': { 'xapi_analysis.input_csv.StatementPipeline': ( 'input_csv.html#statementpipeline',
+                                                                                        'xapi_analysis/input_csv.py'),
+                                         'xapi_analysis.input_csv.StatementPipeline.__call__': ( 'input_csv.html#statementpipeline.__call__',
+                                                                                                 'xapi_analysis/input_csv.py'),
+                                         'xapi_analysis.input_csv.StatementPipeline.__init__': ( 'input_csv.html#statementpipeline.__init__',
+                                                                                                 'xapi_analysis/input_csv.py'),
+                                         'xapi_analysis.input_csv.StatementPipeline.__repr__': ( 'input_csv.html#statementpipeline.__repr__',
+                                                                                                 'xapi_analysis/input_csv.py'),
+                                         'xapi_analysis.input_csv.StatementPipeline._normalize': ( 'input_csv.html#statementpipeline._normalize',
+                                                                                                   'xapi_analysis/input_csv.py'),
+                                         'xapi_analysis.input_csv._as_bool': ('input_csv.html#_as_bool', 'xapi_analysis/input_csv.py'),
+                                         'xapi_analysis.input_csv._as_float': ('input_csv.html#_as_float', 'xapi_analysis/input_csv.py'),
+                                         'xapi_analysis.input_csv._average_partial': ( 'input_csv.html#_average_partial',
+                                                                                       'xapi_analysis/input_csv.py'),
+                                         'xapi_analysis.input_csv._average_result': ( 'input_csv.html#_average_result',
+                                                                                      'xapi_analysis/input_csv.py'),
+                                         'xapi_analysis.input_csv._checked_index': ( 'input_csv.html#_checked_index',
+                                                                                     'xapi_analysis/input_csv.py'),
+                                         'xapi_analysis.input_csv._count_partial': ( 'input_csv.html#_count_partial',
+                                                                                     'xapi_analysis/input_csv.py'),
+                                         'xapi_analysis.input_csv._count_result': ( 'input_csv.html#_count_result',
+                                                                                    'xapi_analysis/input_csv.py'),
+                                         'xapi_analysis.input_csv._duration_seconds': ( 'input_csv.html#_duration_seconds',
+                                                                                        'xapi_analysis/input_csv.py'),
+                                         'xapi_analysis.input_csv._extract_value': ( 'input_csv.html#_extract_value',
+                                                                                     'xapi_analysis/input_csv.py'),
+                                         'xapi_analysis.input_csv._is_query': ('input_csv.html#_is_query', 'xapi_analysis/input_csv.py'),
+                                         'xapi_analysis.input_csv._iter_chunks': ( 'input_csv.html#_iter_chunks',
+                                                                                   'xapi_analysis/input_csv.py'),
+                                         'xapi_analysis.input_csv._map_categories': ( 'input_csv.html#_map_categories',
+                                                                                      'xapi_analysis/input_csv.py'),
+                                         'xapi_analysis.input_csv._map_strings': ( 'input_csv.html#_map_strings',
+                                                                                   'xapi_analysis/input_csv.py'),
+                                         'xapi_analysis.input_csv._merge_partial': ( 'input_csv.html#_merge_partial',
+                                                                                     'xapi_analysis/input_csv.py'),
+                                         'xapi_analysis.input_csv._normalize_statements': ( 'input_csv.html#_normalize_statements',
+                                                                                            'xapi_analysis/input_csv.py'),
+                                         'xapi_analysis.input_csv._remove_values': ( 'input_csv.html#_remove_values',
+                                                                                     'xapi_analysis/input_csv.py'),
+                                         'xapi_analysis.input_csv._result_values': ( 'input_csv.html#_result_values',
+                                                                                     'xapi_analysis/input_csv.py'),
+                                         'xapi_analysis.input_csv._to_dict': ('input_csv.html#_to_dict', 'xapi_analysis/input_csv.py'),
+                                         'xapi_analysis.input_csv._unique_values': ( 'input_csv.html#_unique_values',
+                                                                                     'xapi_analysis/input_csv.py'),
+                                         'xapi_analysis.input_csv.average_interactions': ( 'input_csv.html#average_interactions',
                                                                                            'xapi_analysis/input_csv.py'),
                                          'xapi_analysis.input_csv.count_interactions': ( 'input_csv.html#count_interactions',
                                                                                          'xapi_analysis/input_csv.py'),
@@ -20,6 +133,14 @@ d = { 'settings': { 'branch': 'main',
                                          'xapi_analysis.input_csv.get_all_verbs': ( 'input_csv.html#get_all_verbs',
                                                                                     'xapi_analysis/input_csv.py'),
                                          'xapi_analysis.input_csv.import_csv': ('input_csv.html#import_csv', 'xapi_analysis/input_csv.py'),
+                                         'xapi_analysis.input_csv.import_csv_chunks': ( 'input_csv.html#import_csv_chunks',
+                                                                                        'xapi_analysis/input_csv.py'),
+                                         'xapi_analysis.input_csv.parse_language_map': ( 'input_csv.html#parse_language_map',
+                                                                                         'xapi_analysis/input_csv.py'),
+                                         'xapi_analysis.input_csv.parse_results': ( 'input_csv.html#parse_results',
+                                                                                    'xapi_analysis/input_csv.py'),
+                                         'xapi_analysis.input_csv.parse_timestamps': ( 'input_csv.html#parse_timestamps',
+                                                                                       'xapi_analysis/input_csv.py'),
                                          'xapi_analysis.input_csv.remove_actors': ( 'input_csv.html#remove_actors',
                                                                                     'xapi_analysis/input_csv.py'),
                                          'xapi_analysis.input_csv.remove_verbs': ( 'input_csv.html#remove_verbs',
@@ -32,7 +153,30 @@ d = { 'settings': { 'branch': 'main',
                                                                                         'xapi_analysis/input_csv.py'),
                                          'xapi_analysis.input_csv.to_lowercase': ( 'input_csv.html#to_lowercase',
                                                                                    'xapi_analysis/input_csv.py')},
-            'xapi_analysis.input_json': { 'xapi_analysis.input_json.get_LRS': ('input_json.html#get_lrs', 'xapi_analysis/input_json.py'),
+            'xapi_analysis.input_json': { 'xapi_analysis.input_json.FieldExtractor': ( 'input_json.html#fieldextractor',
+                                                                                       'xapi_analysis/input_json.py'),
+                                          'xapi_analysis.input_json.FieldExtractor.__call__': ( 'input_json.html#fieldextractor.__call__',
+                                                                                                'xapi_analysis/input_json.py'),
+                                          'xapi_analysis.input_json.FieldExtractor.__init__': ( 'input_json.html#fieldextractor.__init__',
+                                                                                                'xapi_analysis/input_json.py'),
+                                          'xapi_analysis.input_json.FieldExtractor.dataframe': ( 'input_json.html#fieldextractor.dataframe',
+                                                                                                 'xapi_analysis/input_json.py'),
+                                          'xapi_analysis.input_json.FieldExtractor.records': ( 'input_json.html#fieldextractor.records',
+                                                                                               'xapi_analysis/input_json.py'),
+                                          'xapi_analysis.input_json.FieldExtractor.values': ( 'input_json.html#fieldextractor.values',
+                                                                                              'xapi_analysis/input_json.py'),
+                                          'xapi_analysis.input_json._compile_paths': ( 'input_json.html#_compile_paths',
+                                                                                       'xapi_analysis/input_json.py'),
+                                          'xapi_analysis.input_json._english': ('input_json.html#_english', 'xapi_analysis/input_json.py'),
+                                          'xapi_analysis.input_json._exact_loads': ( 'input_json.html#_exact_loads',
+                                                                                     'xapi_analysis/input_json.py'),
+                                          'xapi_analysis.input_json._paths_source': ( 'input_json.html#_paths_source',
+                                                                                      'xapi_analysis/input_json.py'),
+                                          'xapi_analysis.input_json._pick_language': ( 'input_json.html#_pick_language',
+                                                                                       'xapi_analysis/input_json.py'),
+                                          'xapi_analysis.input_json._project_statement': ( 'input_json.html#_project_statement',
+                                                                                           'xapi_analysis/input_json.py'),
+                                          'xapi_analysis.input_json.get_LRS': ('input_json.html#get_lrs', 'xapi_analysis/input_json.py'),
                                           'xapi_analysis.input_json.get_actor': ( 'input_json.html#get_actor',
                                                                                   'xapi_analysis/input_json.py'),
                                           'xapi_analysis.input_json.get_actor_name': ( 'input_json.html#get_actor_name',
@@ -82,7 +226,233 @@ d = { 'settings': { 'branch': 'main',
                                                                                   'xapi_analysis/input_json.py'),
                                           'xapi_analysis.input_json.is_voided': ( 'input_json.html#is_voided',
                                                                                   'xapi_analysis/input_json.py'),
+                                          'xapi_analysis.input_json.iter_statements': ( 'input_json.html#iter_statements',
+                                                                                        'xapi_analysis/input_json.py'),
                                           'xapi_analysis.input_json.load_statement': ( 'input_json.html#load_statement',
                                                                                        'xapi_analysis/input_json.py'),
+                                          'xapi_analysis.input_json.load_statements': ( 'input_json.html#load_statements',
+                                                                                        'xapi_analysis/input_json.py'),
+                                          'xapi_analysis.input_json.load_statements_chunks': ( 'input_json.html#load_statements_chunks',
+                                                                                               'xapi_analysis/input_json.py'),
                                           'xapi_analysis.input_json.pretty_print_statement': ( 'input_json.html#pretty_print_statement',
-                                                                                               'xapi_analysis/input_json.py')}}}
+                                                                                               'xapi_analysis/input_json.py'),
+                                          'xapi_analysis.input_json.statements_to_dataframe': ( 'input_json.html#statements_to_dataframe',
+                                                                                                'xapi_analysis/input_json.py')},
+            'xapi_analysis.instrument': { 'xapi_analysis.instrument.LogSink': ('instrument.html#logsink', 'xapi_analysis/instrument.py'),
+                                          'xapi_analysis.instrument.LogSink.__call__': ( 'instrument.html#logsink.__call__',
+                                                                                         'xapi_analysis/instrument.py'),
+                                          'xapi_analysis.instrument.LogSink.__init__': ( 'instrument.html#logsink.__init__',
+                                                                                         'xapi_analysis/instrument.py'),
+                                          'xapi_analysis.instrument.MemorySink': ( 'instrument.html#memorysink',
+                                                                                   'xapi_analysis/instrument.py'),
+                                          'xapi_analysis.instrument.MemorySink.__call__': ( 'instrument.html#memorysink.__call__',
+                                                                                            'xapi_analysis/instrument.py'),
+                                          'xapi_analysis.instrument.MemorySink.__init__': ( 'instrument.html#memorysink.__init__',
+                                                                                            'xapi_analysis/instrument.py'),
+                                          'xapi_analysis.instrument.MemorySink.clear': ( 'instrument.html#memorysink.clear',
+                                                                                         'xapi_analysis/instrument.py'),
+                                          'xapi_analysis.instrument.MemorySink.frame': ( 'instrument.html#memorysink.frame',
+                                                                                         'xapi_analysis/instrument.py'),
+                                          'xapi_analysis.instrument.MemorySink.summary': ( 'instrument.html#memorysink.summary',
+                                                                                           'xapi_analysis/instrument.py'),
+                                          'xapi_analysis.instrument.PrometheusSink': ( 'instrument.html#prometheussink',
+                                                                                       'xapi_analysis/instrument.py'),
+                                          'xapi_analysis.instrument.PrometheusSink.__call__': ( 'instrument.html#prometheussink.__call__',
+                                                                                                'xapi_analysis/instrument.py'),
+                                          'xapi_analysis.instrument.PrometheusSink.__init__': ( 'instrument.html#prometheussink.__init__',
+                                                                                                'xapi_analysis/instrument.py'),
+                                          'xapi_analysis.instrument.PrometheusSink.text': ( 'instrument.html#prometheussink.text',
+                                                                                            'xapi_analysis/instrument.py'),
+                                          'xapi_analysis.instrument.PrometheusSink.write': ( 'instrument.html#prometheussink.write',
+                                                                                             'xapi_analysis/instrument.py'),
+                                          'xapi_analysis.instrument.StageRecord': ( 'instrument.html#stagerecord',
+                                                                                    'xapi_analysis/instrument.py'),
+                                          'xapi_analysis.instrument._Frame': ('instrument.html#_frame', 'xapi_analysis/instrument.py'),
+                                          'xapi_analysis.instrument._Frame.__init__': ( 'instrument.html#_frame.__init__',
+                                                                                        'xapi_analysis/instrument.py'),
+                                          'xapi_analysis.instrument._emit': ('instrument.html#_emit', 'xapi_analysis/instrument.py'),
+                                          'xapi_analysis.instrument._enter': ('instrument.html#_enter', 'xapi_analysis/instrument.py'),
+                                          'xapi_analysis.instrument._exit': ('instrument.html#_exit', 'xapi_analysis/instrument.py'),
+                                          'xapi_analysis.instrument._inputs': ('instrument.html#_inputs', 'xapi_analysis/instrument.py'),
+                                          'xapi_analysis.instrument._measure_call': ( 'instrument.html#_measure_call',
+                                                                                      'xapi_analysis/instrument.py'),
+                                          'xapi_analysis.instrument._measure_generator': ( 'instrument.html#_measure_generator',
+                                                                                           'xapi_analysis/instrument.py'),
+                                          'xapi_analysis.instrument._size': ('instrument.html#_size', 'xapi_analysis/instrument.py'),
+                                          'xapi_analysis.instrument.instrument': ( 'instrument.html#instrument',
+                                                                                   'xapi_analysis/instrument.py'),
+                                          'xapi_analysis.instrument.instrumented': ( 'instrument.html#instrumented',
+                                                                                     'xapi_analysis/instrument.py')},
+            'xapi_analysis.latency': { 'xapi_analysis.latency.LagHistogram': ('latency.html#laghistogram', 'xapi_analysis/latency.py'),
+                                       'xapi_analysis.latency.LagHistogram.__init__': ( 'latency.html#laghistogram.__init__',
+                                                                                        'xapi_analysis/latency.py'),
+                                       'xapi_analysis.latency.LagHistogram.histogram': ( 'latency.html#laghistogram.histogram',
+                                                                                         'xapi_analysis/latency.py'),
+                                       'xapi_analysis.latency.LagHistogram.percentiles': ( 'latency.html#laghistogram.percentiles',
+                                                                                           'xapi_analysis/latency.py'),
+                                       'xapi_analysis.latency.LagHistogram.update': ( 'latency.html#laghistogram.update',
+                                                                                      'xapi_analysis/latency.py'),
+                                       'xapi_analysis.latency._percentile_names': ( 'latency.html#_percentile_names',
+                                                                                    'xapi_analysis/latency.py'),
+                                       'xapi_analysis.latency.ingestion_lag': ('latency.html#ingestion_lag', 'xapi_analysis/latency.py'),
+                                       'xapi_analysis.latency.lag_percentiles': ( 'latency.html#lag_percentiles',
+                                                                                  'xapi_analysis/latency.py')},
+            'xapi_analysis.lrs': { 'xapi_analysis.lrs.LRSClient': ('lrs.html#lrsclient', 'xapi_analysis/lrs.py'),
+                                   'xapi_analysis.lrs.LRSClient.__init__': ('lrs.html#lrsclient.__init__', 'xapi_analysis/lrs.py'),
+                                   'xapi_analysis.lrs.LRSClient.close': ('lrs.html#lrsclient.close', 'xapi_analysis/lrs.py'),
+                                   'xapi_analysis.lrs.LRSClient.frames': ('lrs.html#lrsclient.frames', 'xapi_analysis/lrs.py'),
+                                   'xapi_analysis.lrs.LRSClient.get': ('lrs.html#lrsclient.get', 'xapi_analysis/lrs.py'),
+                                   'xapi_analysis.lrs.LRSClient.pages': ('lrs.html#lrsclient.pages', 'xapi_analysis/lrs.py'),
+                                   'xapi_analysis.lrs._ConnectionPool': ('lrs.html#_connectionpool', 'xapi_analysis/lrs.py'),
+                                   'xapi_analysis.lrs._ConnectionPool.__init__': ( 'lrs.html#_connectionpool.__init__',
+                                                                                   'xapi_analysis/lrs.py'),
+                                   'xapi_analysis.lrs._ConnectionPool.close': ('lrs.html#_connectionpool.close', 'xapi_analysis/lrs.py'),
+                                   'xapi_analysis.lrs._ConnectionPool.request': ( 'lrs.html#_connectionpool.request',
+                                                                                  'xapi_analysis/lrs.py'),
+                                   'xapi_analysis.lrs._Response': ('lrs.html#_response', 'xapi_analysis/lrs.py'),
+                                   'xapi_analysis.lrs._read_response': ('lrs.html#_read_response', 'xapi_analysis/lrs.py'),
+                                   'xapi_analysis.lrs._retry_after': ('lrs.html#_retry_after', 'xapi_analysis/lrs.py'),
+                                   'xapi_analysis.lrs._run': ('lrs.html#_run', 'xapi_analysis/lrs.py'),
+                                   'xapi_analysis.lrs._split_window': ('lrs.html#_split_window', 'xapi_analysis/lrs.py'),
+                                   'xapi_analysis.lrs.fetch_statements': ('lrs.html#fetch_statements', 'xapi_analysis/lrs.py')},
+            'xapi_analysis.matrices': { 'xapi_analysis.matrices.EngagementMatrix': ( 'matrices.html#engagementmatrix',
+                                                                                     'xapi_analysis/matrices.py'),
+                                        'xapi_analysis.matrices.EngagementMatrix.__init__': ( 'matrices.html#engagementmatrix.__init__',
+                                                                                              'xapi_analysis/matrices.py'),
+                                        'xapi_analysis.matrices.EngagementMatrix.snapshot': ( 'matrices.html#engagementmatrix.snapshot',
+                                                                                              'xapi_analysis/matrices.py'),
+                                        'xapi_analysis.matrices.EngagementMatrix.update': ( 'matrices.html#engagementmatrix.update',
+                                                                                            'xapi_analysis/matrices.py'),
+                                        'xapi_analysis.matrices.SparseMatrix': ('matrices.html#sparsematrix', 'xapi_analysis/matrices.py'),
+                                        'xapi_analysis.matrices.SparseMatrix.nnz': ( 'matrices.html#sparsematrix.nnz',
+                                                                                     'xapi_analysis/matrices.py'),
+                                        'xapi_analysis.matrices.SparseMatrix.shape': ( 'matrices.html#sparsematrix.shape',
+                                                                                       'xapi_analysis/matrices.py'),
+                                        'xapi_analysis.matrices.SparseMatrix.to_dense': ( 'matrices.html#sparsematrix.to_dense',
+                                                                                          'xapi_analysis/matrices.py'),
+                                        'xapi_analysis.matrices.SparseMatrix.to_frame': ( 'matrices.html#sparsematrix.to_frame',
+                                                                                          'xapi_analysis/matrices.py'),
+                                        'xapi_analysis.matrices.SparseMatrix.tocoo': ( 'matrices.html#sparsematrix.tocoo',
+                                                                                       'xapi_analysis/matrices.py'),
+                                        'xapi_analysis.matrices.SparseMatrix.tocsr': ( 'matrices.html#sparsematrix.tocsr',
+                                                                                       'xapi_analysis/matrices.py'),
+                                        'xapi_analysis.matrices.TransitionMatrix': ( 'matrices.html#transitionmatrix',
+                                                                                     'xapi_analysis/matrices.py'),
+                                        'xapi_analysis.matrices.TransitionMatrix.__init__': ( 'matrices.html#transitionmatrix.__init__',
+                                                                                              'xapi_analysis/matrices.py'),
+                                        'xapi_analysis.matrices.TransitionMatrix.snapshot': ( 'matrices.html#transitionmatrix.snapshot',
+                                                                                              'xapi_analysis/matrices.py'),
+                                        'xapi_analysis.matrices.TransitionMatrix.update': ( 'matrices.html#transitionmatrix.update',
+                                                                                            'xapi_analysis/matrices.py'),
+                                        'xapi_analysis.matrices._CooSums': ('matrices.html#_coosums', 'xapi_analysis/matrices.py'),
+                                        'xapi_analysis.matrices._CooSums.__init__': ( 'matrices.html#_coosums.__init__',
+                                                                                      'xapi_analysis/matrices.py'),
+                                        'xapi_analysis.matrices._CooSums._merge': ( 'matrices.html#_coosums._merge',
+                                                                                    'xapi_analysis/matrices.py'),
+                                        'xapi_analysis.matrices._CooSums.add': ('matrices.html#_coosums.add', 'xapi_analysis/matrices.py'),
+                                        'xapi_analysis.matrices._CooSums.matrix': ( 'matrices.html#_coosums.matrix',
+                                                                                    'xapi_analysis/matrices.py'),
+                                        'xapi_analysis.matrices._IncrementalMatrix': ( 'matrices.html#_incrementalmatrix',
+                                                                                       'xapi_analysis/matrices.py'),
+                                        'xapi_analysis.matrices._IncrementalMatrix.load': ( 'matrices.html#_incrementalmatrix.load',
+                                                                                            'xapi_analysis/matrices.py'),
+                                        'xapi_analysis.matrices._IncrementalMatrix.save': ( 'matrices.html#_incrementalmatrix.save',
+                                                                                            'xapi_analysis/matrices.py'),
+                                        'xapi_analysis.matrices._Labels': ('matrices.html#_labels', 'xapi_analysis/matrices.py'),
+                                        'xapi_analysis.matrices._Labels.__init__': ( 'matrices.html#_labels.__init__',
+                                                                                     'xapi_analysis/matrices.py'),
+                                        'xapi_analysis.matrices._Labels.encode': ( 'matrices.html#_labels.encode',
+                                                                                   'xapi_analysis/matrices.py'),
+                                        'xapi_analysis.matrices._sum_duplicates': ( 'matrices.html#_sum_duplicates',
+                                                                                    'xapi_analysis/matrices.py'),
+                                        'xapi_analysis.matrices.engagement_matrix': ( 'matrices.html#engagement_matrix',
+                                                                                      'xapi_analysis/matrices.py'),
+                                        'xapi_analysis.matrices.transition_matrix': ( 'matrices.html#transition_matrix',
+                                                                                      'xapi_analysis/matrices.py')},
+            'xapi_analysis.queues': { 'xapi_analysis.queues.QueueHealth': ('queues.html#queuehealth', 'xapi_analysis/queues.py'),
+                                      'xapi_analysis.queues._count_windows': ('queues.html#_count_windows', 'xapi_analysis/queues.py'),
+                                      'xapi_analysis.queues._queue_name': ('queues.html#_queue_name', 'xapi_analysis/queues.py'),
+                                      'xapi_analysis.queues.scan_queues': ('queues.html#scan_queues', 'xapi_analysis/queues.py')},
+            'xapi_analysis.sessions': { 'xapi_analysis.sessions.Sessionizer': ('sessions.html#sessionizer', 'xapi_analysis/sessions.py'),
+                                        'xapi_analysis.sessions.Sessionizer.__init__': ( 'sessions.html#sessionizer.__init__',
+                                                                                         'xapi_analysis/sessions.py'),
+                                        'xapi_analysis.sessions.Sessionizer.process': ( 'sessions.html#sessionizer.process',
+                                                                                        'xapi_analysis/sessions.py'),
+                                        'xapi_analysis.sessions.Sessionizer.process_chunks': ( 'sessions.html#sessionizer.process_chunks',
+                                                                                               'xapi_analysis/sessions.py'),
+                                        'xapi_analysis.sessions.session_summary': ( 'sessions.html#session_summary',
+                                                                                    'xapi_analysis/sessions.py'),
+                                        'xapi_analysis.sessions.sessionize': ('sessions.html#sessionize', 'xapi_analysis/sessions.py'),
+                                        'xapi_analysis.sessions.time_on_task': ('sessions.html#time_on_task', 'xapi_analysis/sessions.py')},
+            'xapi_analysis.statement_index': { 'xapi_analysis.statement_index.StatementIndex': ( 'statement_index.html#statementindex',
+                                                                                                 'xapi_analysis/statement_index.py'),
+                                               'xapi_analysis.statement_index.StatementIndex.__init__': ( 'statement_index.html#statementindex.__init__',
+                                                                                                          'xapi_analysis/statement_index.py'),
+                                               'xapi_analysis.statement_index.StatementIndex.__repr__': ( 'statement_index.html#statementindex.__repr__',
+                                                                                                          'xapi_analysis/statement_index.py'),
+                                               'xapi_analysis.statement_index.StatementIndex._col_positions': ( 'statement_index.html#statementindex._col_positions',
+                                                                                                                'xapi_analysis/statement_index.py'),
+                                               'xapi_analysis.statement_index.StatementIndex.is_valid': ( 'statement_index.html#statementindex.is_valid',
+                                                                                                          'xapi_analysis/statement_index.py'),
+                                               'xapi_analysis.statement_index.StatementIndex.positions': ( 'statement_index.html#statementindex.positions',
+                                                                                                           'xapi_analysis/statement_index.py'),
+                                               'xapi_analysis.statement_index._group_positions': ( 'statement_index.html#_group_positions',
+                                                                                                   'xapi_analysis/statement_index.py')},
+            'xapi_analysis.store': { 'xapi_analysis.store.StatementQuery': ('store.html#statementquery', 'xapi_analysis/store.py'),
+                                     'xapi_analysis.store.StatementQuery.__init__': ( 'store.html#statementquery.__init__',
+                                                                                      'xapi_analysis/store.py'),
+                                     'xapi_analysis.store.StatementQuery.__len__': ( 'store.html#statementquery.__len__',
+                                                                                     'xapi_analysis/store.py'),
+                                     'xapi_analysis.store.StatementQuery._parse': ( 'store.html#statementquery._parse',
+                                                                                    'xapi_analysis/store.py'),
+                                     'xapi_analysis.store.StatementQuery._read': ( 'store.html#statementquery._read',
+                                                                                   'xapi_analysis/store.py'),
+                                     'xapi_analysis.store.StatementQuery._remove_values': ( 'store.html#statementquery._remove_values',
+                                                                                            'xapi_analysis/store.py'),
+                                     'xapi_analysis.store.StatementQuery._unique_values': ( 'store.html#statementquery._unique_values',
+                                                                                            'xapi_analysis/store.py'),
+                                     'xapi_analysis.store.StatementQuery._where': ( 'store.html#statementquery._where',
+                                                                                    'xapi_analysis/store.py'),
+                                     'xapi_analysis.store.StatementQuery.average_interactions': ( 'store.html#statementquery.average_interactions',
+                                                                                                  'xapi_analysis/store.py'),
+                                     'xapi_analysis.store.StatementQuery.chunks': ( 'store.html#statementquery.chunks',
+                                                                                    'xapi_analysis/store.py'),
+                                     'xapi_analysis.store.StatementQuery.count_interactions': ( 'store.html#statementquery.count_interactions',
+                                                                                                'xapi_analysis/store.py'),
+                                     'xapi_analysis.store.StatementQuery.get_all_actors': ( 'store.html#statementquery.get_all_actors',
+                                                                                            'xapi_analysis/store.py'),
+                                     'xapi_analysis.store.StatementQuery.get_all_objects': ( 'store.html#statementquery.get_all_objects',
+                                                                                             'xapi_analysis/store.py'),
+                                     'xapi_analysis.store.StatementQuery.get_all_verbs': ( 'store.html#statementquery.get_all_verbs',
+                                                                                           'xapi_analysis/store.py'),
+                                     'xapi_analysis.store.StatementQuery.remove_actors': ( 'store.html#statementquery.remove_actors',
+                                                                                           'xapi_analysis/store.py'),
+                                     'xapi_analysis.store.StatementQuery.remove_verbs': ( 'store.html#statementquery.remove_verbs',
+                                                                                          'xapi_analysis/store.py'),
+                                     'xapi_analysis.store.StatementQuery.subset_actor_verb': ( 'store.html#statementquery.subset_actor_verb',
+                                                                                               'xapi_analysis/store.py'),
+                                     'xapi_analysis.store.StatementQuery.to_frame': ( 'store.html#statementquery.to_frame',
+                                                                                      'xapi_analysis/store.py'),
+                                     'xapi_analysis.store.StatementStore': ('store.html#statementstore', 'xapi_analysis/store.py'),
+                                     'xapi_analysis.store.StatementStore.__init__': ( 'store.html#statementstore.__init__',
+                                                                                      'xapi_analysis/store.py'),
+                                     'xapi_analysis.store.StatementStore.append': ( 'store.html#statementstore.append',
+                                                                                    'xapi_analysis/store.py'),
+                                     'xapi_analysis.store.StatementStore.close': ( 'store.html#statementstore.close',
+                                                                                   'xapi_analysis/store.py'),
+                                     'xapi_analysis.store.StatementStore.columns': ( 'store.html#statementstore.columns',
+                                                                                     'xapi_analysis/store.py'),
+                                     'xapi_analysis.store._quote': ('store.html#_quote', 'xapi_analysis/store.py')},
+            'xapi_analysis.synthetic': { 'xapi_analysis.synthetic._format_dates': ( 'synthetic.html#_format_dates',
+                                                                                    'xapi_analysis/synthetic.py'),
+                                         'xapi_analysis.synthetic._json_statements': ( 'synthetic.html#_json_statements',
+                                                                                       'xapi_analysis/synthetic.py'),
+                                         'xapi_analysis.synthetic._map_names': ('synthetic.html#_map_names', 'xapi_analysis/synthetic.py'),
+                                         'xapi_analysis.synthetic._results': ('synthetic.html#_results', 'xapi_analysis/synthetic.py'),
+                                         'xapi_analysis.synthetic._zipf_choice': ( 'synthetic.html#_zipf_choice',
+                                                                                   'xapi_analysis/synthetic.py'),
+                                         'xapi_analysis.synthetic.generate_statements': ( 'synthetic.html#generate_statements',
+                                                                                          'xapi_analysis/synthetic.py'),
+                                         'xapi_analysis.synthetic.to_schema': ('synthetic.html#to_schema', 'xapi_analysis/synthetic.py'),
+                                         'xapi_analysis.synthetic.write_statements': ( 'synthetic.html#write_statements',
+                                                                                       'xapi_analysis/synthetic.py')}}}
@@ -0,0 +1,78 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/05_aggregate.ipynb.
+
+# %% auto 0
+__all__ = ['InteractionCounts', 'InteractionAverages']
+
+# %% ../nbs/05_aggregate.ipynb 4
+import pandas as pd
+from pathlib import Path
+from typing import Union, Iterable
+from .input_csv import _iter_chunks, _merge_partial, _count_partial, _count_result
+from .input_csv import _average_partial, _average_result
+
+# %% ../nbs/05_aggregate.ipynb 7
+class InteractionCounts:
+    "Incremental version of `count_interactions`"
+    def __init__(self,
+                 df: Union[pd.DataFrame, Iterable[pd.DataFrame]] = None # The statements used to initialize the counts
+                ):
+        self.counts = None
+        if df is not None:
+            self.update(df)
+
+    def update(self, df: Union[pd.DataFrame, Iterable[pd.DataFrame]] # A new batch of statements, or an iterable of chunks
+              ) -> 'InteractionCounts':
+        "Adds the counts of a new batch of statements"
+        for chunk in _iter_chunks(df):
+            self.counts = _merge_partial(self.counts, _count_partial(chunk))
+        return self
+
+    def snapshot(self) -> pd.DataFrame:
+        "The number of interactions of each actor, like `count_interactions`"
+        return _count_result(self.counts)
+
+    def save(self, path: Union[str, Path]):
+        "Stores the counts on disk"
+        pd.to_pickle({'counts': self.counts}, path)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> 'InteractionCounts':
+        "Loads the counts stored with `save`"
+        agg = cls()
+        agg.counts = pd.read_pickle(path)['counts']
+        return agg
+
+# %% ../nbs/05_aggregate.ipynb 10
+class InteractionAverages:
+    "Incremental version of `average_interactions`"
+    def __init__(self,
+                 avg_col: str, # The column on which to compute average
+                 user_col: str = 'actor', # The column to groupby (usually **actor**)
+                 df: Union[pd.DataFrame, Iterable[pd.DataFrame]] = None # The statements used to initialize the averages
+                ):
+        self.avg_col, self.user_col, self.totals = avg_col, user_col, None
+        if df is not None:
+            self.update(df)
+
+    def update(self, df: Union[pd.DataFrame, Iterable[pd.DataFrame]] # A new batch of statements, or an iterable of chunks
+              ) -> 'InteractionAverages':
+        "Adds the sums and counts of a new batch of statements"
+        for chunk in _iter_chunks(df):
+            self.totals = _merge_partial(self.totals, _average_partial(chunk, self.avg_col, self.user_col))
+        return self
+
+    def snapshot(self) -> pd.DataFrame:
+        "The average of `avg_col` for each value of `user_col`, like `average_interactions`"
+        return _average_result(self.totals, self.avg_col, self.user_col)
+
+    def save(self, path: Union[str, Path]):
+        "Stores the sums and counts on disk"
+        pd.to_pickle({'avg_col': self.avg_col, 'user_col': self.user_col, 'totals': self.totals}, path)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> 'InteractionAverages':
+        "Loads the sums and counts stored with `save`"
+        state = pd.read_pickle(path)
+        agg = cls(state['avg_col'], state['user_col'])
+        agg.totals = state['totals']
+        return agg
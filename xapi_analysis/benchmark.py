@@ -0,0 +1,148 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/13_benchmark.ipynb.
+
+# %% auto 0
+__all__ = ['benchmark_cases', 'benchmark_data', 'run_benchmarks', 'save_baseline', 'load_baseline', 'compare_to_baseline',
+           'benchmark_cli']
+
+# %% ../nbs/13_benchmark.ipynb 4
+import json
+import platform
+import tempfile
+import time
+import tracemalloc
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import Union, List, Dict, Callable, Sequence
+from fastcore.script import call_parse, Param
+from .input_csv import *
+from .input_json import load_statements, iter_statements
+from .synthetic import generate_statements, write_statements
+from . import __version__
+
+# %% ../nbs/13_benchmark.ipynb 6
+benchmark_cases: Dict[str, Callable[[dict], object]] = {
+    'import_csv': lambda d: import_csv(d['csv_file'], index_col=None, delimiter=','),
+    'import_csv(categorical)': lambda d: import_csv(d['csv_file'], index_col=None, delimiter=',', categorical=True),
+    'import_csv(results)': lambda d: import_csv(d['csv_file'], index_col=None, delimiter=',', results=True),
+    'import_csv_chunks': lambda d: sum(len(c) for c in import_csv_chunks(d['csv_file'], index_col=None, delimiter=',')),
+    'iter_statements': lambda d: sum(1 for _ in iter_statements(d['ndjson_file'])),
+    'load_statements': lambda d: load_statements(d['ndjson_file']),
+    'get_all_verbs': lambda d: get_all_verbs(d['df']),
+    'get_all_actors': lambda d: get_all_actors(d['df']),
+    'get_all_objects': lambda d: get_all_objects(d['df']),
+    'remove_whitespaces': lambda d: remove_whitespaces(d['df'], ['actor']),
+    'to_lowercase': lambda d: to_lowercase(d['df'], ['actor']),
+    'remove_actors': lambda d: remove_actors(d['df'], d['actors']),
+    'remove_verbs': lambda d: remove_verbs(d['df'], d['verbs']),
+    'subset_actor_verb': lambda d: subset_actor_verb(d['df'], d['actors'][0], d['verbs'][0]),
+    'count_interactions': lambda d: count_interactions(d['df']),
+    'count_interactions(categorical)': lambda d: count_interactions(d['cat_df']),
+    'average_interactions': lambda d: average_interactions(d['df'], 'score.raw'),
+    'parse_results': lambda d: parse_results(d['df']['result']),
+    'split_column': lambda d: split_column(d['df'], 'object', ['course', 'lesson']),
+    'StatementPipeline': lambda d: StatementPipeline(['actor'], ['actor'], d['actors'], d['verbs'])(d['df']),
+}
+
+def benchmark_data(n: int, # The number of statements
+                   directory: Union[str, Path], # The folder where the files are written
+                   **generator_params # The parameters of `synthetic.generate_statements`
+                  ) -> dict: # The dataset used by `benchmark_cases`
+    "Generates the synthetic dataset of `n` statements used by the benchmark cases"
+    statements = generate_statements(n, **generator_params)
+    csv_file = write_statements(statements, Path(directory)/f'statements_{n}.csv', schema='example_2')
+    ndjson_file = write_statements(statements, Path(directory)/f'statements_{n}.ndjson', format='ndjson')
+    df = import_csv(csv_file, index_col=None, delimiter=',', results=True)
+    actors = df['actor'].value_counts().index[:10].tolist()
+    return dict(csv_file=csv_file, ndjson_file=ndjson_file, df=df, actors=actors, verbs=['Logged In', 'Logged Out'],
+                cat_df=df.astype({'actor': 'category', 'verb': 'category', 'object': 'category'}))
+
+# %% ../nbs/13_benchmark.ipynb 8
+def _fresh(data: dict) -> dict:
+    "Copies the dataframes of `data`, since some cases modify them in place"
+    return {k: v.copy() if isinstance(v, pd.DataFrame) else v for k, v in data.items()}
+
+def _measure(case: Callable, data: dict, repeat: int, memory: bool) -> dict:
+    times = []
+    for _ in range(repeat):
+        run_data = _fresh(data)
+        start = time.perf_counter()
+        case(run_data)
+        times.append(time.perf_counter() - start)
+    peak = np.nan
+    if memory:
+        run_data = _fresh(data)
+        tracemalloc.start()
+        try:
+            case(run_data)
+            peak = tracemalloc.get_traced_memory()[1] / 2**20
+        finally:
+            tracemalloc.stop()
+    return dict(seconds=min(times), peak_mb=peak)
+
+def run_benchmarks(sizes: Sequence[int] = (10_000, 100_000), # The numbers of statements of the datasets
+                   cases: Sequence[str] = None, # The names of the cases in `benchmark_cases`, all if not given
+                   repeat: int = 3, # The number of times each case is timed
+                   memory: bool = True, # Whether the peak memory is measured
+                   **generator_params # The parameters of `synthetic.generate_statements`
+                  ) -> pd.DataFrame: # The time and memory of each case for each size
+    """
+    Measures the time and the peak memory of the benchmark cases on synthetic datasets of increasing size
+    """
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for n in sizes:
+            data = benchmark_data(n, directory, **generator_params)
+            for name in cases or benchmark_cases:
+                results.append(dict(case=name, rows=n, **_measure(benchmark_cases[name], data, repeat, memory)))
+    results = pd.DataFrame(results)
+    results['rows_per_second'] = results['rows'] / results['seconds']
+    return results
+
+# %% ../nbs/13_benchmark.ipynb 12
+def save_baseline(results: pd.DataFrame, # The results of `run_benchmarks`
+                  path: Union[str, Path] # The json file
+                 ):
+    "Saves the results of the benchmarks, with the versions of the software used"
+    environment = dict(xapi_analysis=__version__, pandas=pd.__version__, numpy=np.__version__,
+                       python=platform.python_version(), machine=platform.machine(), created=pd.Timestamp.now('UTC').isoformat())
+    Path(path).write_text(json.dumps(dict(environment=environment, results=results.to_dict(orient='records')), indent=1))
+
+def load_baseline(path: Union[str, Path] # The json file written by `save_baseline`
+                 ) -> pd.DataFrame: # The results of the benchmarks
+    "Loads the results of the benchmarks saved with `save_baseline`"
+    return pd.DataFrame(json.loads(Path(path).read_text())['results'])
+
+def compare_to_baseline(results: pd.DataFrame, # The results of `run_benchmarks`
+                        baseline: Union[pd.DataFrame, str, Path], # The baseline results, or the json file containing them
+                        tolerance: float = 1.5 # The maximum ratio between the new and the baseline measures
+                       ) -> pd.DataFrame: # The ratios of the measures of the cases in both results
+    """
+    Compares the time and memory of the benchmarks with a baseline, marking the regressions
+    """
+    if not isinstance(baseline, pd.DataFrame):
+        baseline = load_baseline(baseline)
+    df = results.merge(baseline, on=['case', 'rows'], suffixes=('', '_baseline'))
+    df['time_ratio'] = df['seconds'] / df['seconds_baseline']
+    df['memory_ratio'] = df['peak_mb'] / df['peak_mb_baseline']
+    df['regression'] = (df['time_ratio'] > tolerance) | (df['memory_ratio'] > tolerance)
+    return df[['case', 'rows', 'seconds', 'seconds_baseline', 'time_ratio', 'peak_mb', 'peak_mb_baseline', 'memory_ratio', 'regression']]
+
+# %% ../nbs/13_benchmark.ipynb 15
+@call_parse
+def benchmark_cli(sizes: Param("The numbers of statements of the datasets", int, nargs='+') = [10_000, 100_000],
+                  cases: Param("The names of the cases to run, all if not given", str, nargs='+') = None,
+                  repeat: Param("The number of times each case is timed", int) = 3,
+                  output: Param("The json file where the results are saved", str) = None,
+                  baseline: Param("A json file with the results to compare with", str) = None,
+                  tolerance: Param("The maximum ratio between the new and the baseline measures", float) = 1.5):
+    "Runs the benchmarks, saving the results and comparing them with a baseline"
+    results = run_benchmarks(sizes, cases, repeat)
+    print(results.to_string(index=False))
+    if output is not None:
+        save_baseline(results, output)
+    if baseline is not None:
+        comparison = compare_to_baseline(results, baseline, tolerance)
+        print(comparison.to_string(index=False))
+        if comparison['regression'].any():
+            raise SystemExit(1)
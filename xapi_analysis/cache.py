@@ -0,0 +1,118 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/02_cache.ipynb.
+
+# %% auto 0
+__all__ = ['cache_key', 'cache_size', 'evict_cache', 'invalidate_cache', 'cached_import_csv']
+
+# %% ../nbs/02_cache.ipynb 4
+import hashlib
+import json
+import os
+import threading
+import pandas as pd
+from pathlib import Path
+from typing import Union, List
+from . import __version__
+from .input_csv import import_csv
+
+# %% ../nbs/02_cache.ipynb 8
+def _source_prefix(csv_file: Union[str, Path]) -> str:
+    return hashlib.sha1(str(Path(csv_file).resolve()).encode()).hexdigest()[:16]
+
+def cache_key(csv_file: Union[str, Path], # Filename of the csv with the data
+              **import_params # The arguments passed to `import_csv`
+             ) -> str: # The name of the cached file
+    """
+    Returns the name of the file caching the statements imported from `csv_file` with the given arguments
+    """
+    stat = Path(csv_file).stat()
+    key = json.dumps([str(Path(csv_file).resolve()), stat.st_size, stat.st_mtime_ns,
+                      sorted(import_params.items()), __version__], default=str)
+    return f"{_source_prefix(csv_file)}-{hashlib.sha1(key.encode()).hexdigest()[:16]}.feather"
+
+# %% ../nbs/02_cache.ipynb 11
+def cache_size(cache_dir: Union[str, Path] # The folder containing the cached files
+              ) -> int: # The total size in bytes of the cached files
+    """
+    Returns the space on disk used by the cache
+    """
+    return sum(f.stat().st_size for f in Path(cache_dir).glob('*.feather'))
+
+def evict_cache(cache_dir: Union[str, Path], # The folder containing the cached files
+                max_bytes: int # The maximum size in bytes of the cache
+               ) -> List[Path]: # The files which were removed from the cache
+    """
+    Removes the least recently used files from the cache, until its total size is at most `max_bytes`
+    """
+    files = sorted(Path(cache_dir).glob('*.feather'), key=lambda f: f.stat().st_mtime_ns)
+    total, removed = sum(f.stat().st_size for f in files), []
+    for f in files:
+        if total <= max_bytes:
+            break
+        total -= f.stat().st_size
+        f.unlink()
+        removed.append(f)
+    return removed
+
+def invalidate_cache(cache_dir: Union[str, Path], # The folder containing the cached files
+                     csv_file: Union[str, Path, None] = None # Only remove the entries of this csv file
+                    ) -> List[Path]: # The files which were removed from the cache
+    """
+    Removes from the cache all the entries associated to `csv_file`, or all the entries if no file is specified
+    """
+    pattern = '*.feather' if csv_file is None else f"{_source_prefix(csv_file)}-*.feather"
+    removed = list(Path(cache_dir).glob(pattern))
+    for f in removed:
+        f.unlink()
+    return removed
+
+# %% ../nbs/02_cache.ipynb 12
+_attrs_key = b'xapi_analysis.attrs'
+
+def _json_attrs(attrs: dict) -> dict:
+    "The attributes of a DataFrame which can be stored as json"
+    stored = {}
+    for k, v in attrs.items():
+        try:
+            json.dumps(v)
+        except TypeError:
+            continue
+        stored[k] = v
+    return stored
+
+def cached_import_csv(csv_file: Union[str, Path], # Filename of the csv with the data
+                      cache_dir: Union[str, Path] = '.xapi_cache', # The folder containing the cached files
+                      max_bytes: int = 2**30, # The maximum size in bytes of the cache
+                      **import_params # Other arguments passed to `import_csv`
+                     ) -> pd.DataFrame: # The imported dataframe with all the xAPI statements
+    """
+    Same as `import_csv`, but the DataFrame is stored in a cache on disk the first time the file is imported
+    and read from there afterwards
+    """
+    try:
+        import pyarrow as pa
+        from pyarrow import feather
+    except ImportError as e:
+        raise ImportError("cached_import_csv requires pyarrow, which can be installed with `pip install pyarrow`") from e
+    if not Path(csv_file).exists():
+        return import_csv(csv_file, **import_params)
+    cache_file = Path(cache_dir)/cache_key(csv_file, **import_params)
+    if cache_file.exists():
+        os.utime(cache_file)
+        table = feather.read_table(cache_file, memory_map=True)
+        df = table.to_pandas()
+        df.attrs = json.loads((table.schema.metadata or {}).get(_attrs_key, b'{}'))
+        return df
+    df = import_csv(csv_file, **import_params)
+    Path(cache_dir).mkdir(parents=True, exist_ok=True)
+    tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}-{threading.get_ident()}.tmp")
+    try:
+        table = pa.Table.from_pandas(df)
+        table = table.replace_schema_metadata({**table.schema.metadata, _attrs_key: json.dumps(_json_attrs(df.attrs))})
+        feather.write_feather(table, tmp_file, compression='uncompressed')
+    except Exception as e:
+        print(f"The statements could not be cached: {e}")
+        tmp_file.unlink(missing_ok=True)
+        return df
+    tmp_file.replace(cache_file)
+    evict_cache(cache_dir, max_bytes)
+    return df
@@ -0,0 +1,117 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/09_dedup.ipynb.
+
+# %% auto 0
+__all__ = ['id_columns', 'content_columns', 'statement_key', 'drop_duplicate_statements', 'BloomFilter', 'StatementDeduplicator']
+
+# %% ../nbs/09_dedup.ipynb 4
+import math
+import numpy as np
+import pandas as pd
+from typing import Union, List, Iterable, Iterator
+from .input_csv import _iter_chunks
+
+# %% ../nbs/09_dedup.ipynb 8
+id_columns = ['_id', 'id', 'hash']
+content_columns = ['timestamp', 'actor', 'verb', 'object']
+
+def statement_key(df: pd.DataFrame, # The dataset containing the xAPI statements
+                  key: Union[str, List[str]] = None # The columns identifying a statement, chosen automatically if not given
+                 ) -> List[str]: # The columns identifying a statement
+    """
+    Returns the columns used to identify the statements: `key` if given, otherwise the first column of `id_columns`
+    without missing values, otherwise the columns of `content_columns` in the dataset
+    """
+    if key is not None:
+        return [key] if isinstance(key, str) else list(key)
+    for col in id_columns:
+        if col in df.columns and df[col].notna().all():
+            return [col]
+    cols = [col for col in content_columns if col in df.columns]
+    if not cols:
+        raise KeyError(f"The dataset has none of the columns {id_columns + content_columns}")
+    return cols
+
+# %% ../nbs/09_dedup.ipynb 11
+def drop_duplicate_statements(df: pd.DataFrame, # The dataset containing the xAPI statements
+                              key: Union[str, List[str]] = None # The columns identifying a statement, see `statement_key`
+                             ) -> pd.DataFrame: # The dataset without the repeated statements
+    """
+    Removes the statements that already appeared in the dataset, keeping their first occurrence
+    """
+    return df[~df.duplicated(subset=statement_key(df, key), keep='first')]
+
+# %% ../nbs/09_dedup.ipynb 14
+def _statement_hashes(df: pd.DataFrame, cols: List[str]) -> np.ndarray:
+    "A 64-bit hash of the key of each statement, which does not depend on the chunk it belongs to"
+    return pd.util.hash_pandas_object(df[cols], index=False).to_numpy()
+
+class BloomFilter:
+    "A set of 64-bit hashes of fixed size, answering membership with a bounded rate of false positives"
+    def __init__(self,
+                 capacity: int, # The number of distinct elements the filter is sized for
+                 error_rate: float = 1e-3 # The probability of false positives when `capacity` elements are added
+                ):
+        self.n_bits = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.n_hashes = max(1, round(self.n_bits / capacity * math.log(2)))
+        self.bits = np.zeros((self.n_bits + 7) // 8, dtype=np.uint8)
+
+    def _positions(self, hashes: np.ndarray) -> np.ndarray:
+        # double hashing: the i-th position is h1 + i * h2, from the two halves of the hash
+        h1, h2 = hashes & np.uint64(0xFFFFFFFF), (hashes >> np.uint64(32)) | np.uint64(1)
+        return (h1[:, None] + np.arange(self.n_hashes, dtype=np.uint64) * h2[:, None]) % np.uint64(self.n_bits)
+
+    def contains(self, hashes: np.ndarray # The 64-bit hashes of the elements
+                ) -> np.ndarray: # Whether each element was (probably) already added
+        pos = self._positions(hashes)
+        return ((self.bits[pos >> np.uint64(3)] >> (pos & np.uint64(7)).astype(np.uint8)) & 1).all(axis=1)
+
+    def add(self, hashes: np.ndarray # The 64-bit hashes of the elements
+           ):
+        pos = self._positions(hashes).ravel()
+        np.bitwise_or.at(self.bits, pos >> np.uint64(3), np.left_shift(1, pos & np.uint64(7)).astype(np.uint8))
+
+# %% ../nbs/09_dedup.ipynb 16
+class StatementDeduplicator:
+    "Removes the statements already seen from a stream of chunks"
+    def __init__(self,
+                 key: Union[str, List[str]] = None, # The columns identifying a statement, see `statement_key`
+                 capacity: int = None, # If given, the seen statements are stored in a Bloom filter sized for this number of statements
+                 error_rate: float = 1e-3 # The probability of dropping a new statement, when `capacity` is given
+                ):
+        self.key = key
+        self.bloom = None if capacity is None else BloomFilter(capacity, error_rate)
+        self.seen = set()
+        self.n_seen = self.n_dropped = 0
+
+    def __call__(self, df: pd.DataFrame # A chunk of statements
+                ) -> pd.DataFrame: # The statements of the chunk that were not seen before
+        if self.key is None:
+            # the key is chosen on the first chunk, and kept for the whole stream
+            self.key = statement_key(df)
+        cols = statement_key(df, self.key)
+        hashes = _statement_hashes(df, cols)
+        # the statements of a later chunk without a value of the key are identified by their content,
+        # or kept as they are if the dataset has no content columns
+        missing = df[cols].isna().any(axis=1).to_numpy()
+        content = [col for col in content_columns if col in df.columns]
+        unknown = np.zeros(len(df), dtype=bool)
+        if missing.any():
+            if content and content != cols:
+                hashes[missing] = _statement_hashes(df[missing], content)
+            else:
+                unknown = missing
+        new = ~pd.Series(hashes).duplicated().to_numpy() & ~unknown
+        if self.bloom is not None:
+            new &= ~self.bloom.contains(hashes)
+            self.bloom.add(hashes[new])
+        else:
+            new &= ~np.fromiter((h in self.seen for h in hashes.tolist()), dtype=bool, count=len(hashes))
+            self.seen.update(hashes[new].tolist())
+        self.n_seen += int(new.sum())
+        self.n_dropped += len(df) - int(new.sum()) - int(unknown.sum())
+        return df[new | unknown]
+
+    def filter(self, df: Union[pd.DataFrame, Iterable[pd.DataFrame]] # A dataset or an iterable of chunks
+              ) -> Iterator[pd.DataFrame]: # The chunks without the statements seen before
+        for chunk in _iter_chunks(df):
+            yield self(chunk)
@@ -0,0 +1,74 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/03_ingest.ipynb.
+
+# %% auto 0
+__all__ = ['sniff_csv', 'expand_paths', 'import_csv_files']
+
+# %% ../nbs/03_ingest.ipynb 4
+import glob
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Union, List, Dict
+from .input_csv import import_csv
+
+# %% ../nbs/03_ingest.ipynb 7
+def sniff_csv(csv_file: Union[str, Path], # Filename of the csv with the data
+              delimiters: str = ',;\t|' # The candidate delimiters
+             ) -> dict: # The arguments to pass to `import_csv` for this file
+    """
+    Detects the delimiter and the index column of a csv file from its header
+    """
+    with open(csv_file, encoding='utf-8-sig') as f:
+        header = f.readline()
+    delimiter = max(delimiters, key=header.count)
+    index_col = 0 if header.split(delimiter)[0].strip() == '' else None
+    return dict(index_col=index_col, delimiter=delimiter)
+
+# %% ../nbs/03_ingest.ipynb 10
+def expand_paths(paths: Union[str, Path, List] # A file, a folder, a glob pattern or a list of them
+                ) -> List[Path]: # The list of csv files
+    """
+    Returns the sorted list of files identified by `paths`
+    """
+    if isinstance(paths, (list, tuple)):
+        return [f for p in paths for f in expand_paths(p)]
+    if Path(paths).is_dir():
+        return sorted(Path(paths).glob('*.csv'))
+    if glob.has_magic(str(paths)):
+        return [Path(f) for f in sorted(glob.glob(str(paths)))]
+    return [Path(paths)]
+
+def _import_sniffed(csv_file: Path, source_col: str, import_params: dict) -> pd.DataFrame:
+    "Imports a single file with the detected format, adding a column with its name"
+    df = import_csv(csv_file, **sniff_csv(csv_file), **import_params)
+    df[source_col] = str(csv_file)
+    return df
+
+# %% ../nbs/03_ingest.ipynb 12
+def import_csv_files(paths: Union[str, Path, List], # A file, a folder, a glob pattern or a list of them
+                     processes: int = None, # Number of processes parsing the files. Defaults to the number of CPUs
+                     source_col: str = 'source_file', # Name of the column containing the name of the file
+                     concat: bool = True, # Whether to concatenate the results in a single DataFrame
+                     **import_params # Other arguments passed to `import_csv`, like *categorical* or *pipeline*
+                    ) -> Union[pd.DataFrame, Dict[str, pd.DataFrame]]: # The imported statements
+    """
+    Imports in parallel all the csv files identified by `paths`, detecting the format of each file
+    """
+    files = expand_paths(paths)
+    args = [(f, source_col, import_params) for f in files]
+    if processes == 1 or len(files) <= 1:
+        dfs = [_import_sniffed(*a) for a in args]
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            dfs = list(pool.map(_import_sniffed, *zip(*args)))
+    if not concat:
+        return {str(f): df for f, df in zip(files, dfs)}
+    if not dfs:
+        return pd.DataFrame()
+    df = pd.concat(dfs, ignore_index=True)
+    # categorical columns with different categories in each file are concatenated as objects
+    for col in dfs[0].columns:
+        if isinstance(dfs[0][col].dtype, pd.CategoricalDtype) and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype('category')
+    df[source_col] = df[source_col].astype('category')
+    return df
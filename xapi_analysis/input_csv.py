@@ -1,109 +1,292 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/01_input_csv.ipynb.
 
 # %% auto 0
-__all__ = ['import_csv', 'get_all_verbs', 'get_all_actors', 'get_all_objects', 'remove_whitespaces', 'to_lowercase',
-           'remove_actors', 'remove_verbs', 'count_interactions', 'create_barplot', 'subset_actor_verb', 'split_column',
-           'average_interactions']
+__all__ = ['result_columns', 'parse_language_map', 'parse_timestamps', 'import_csv', 'parse_results', 'import_csv_chunks',
+           'get_all_verbs', 'get_all_actors', 'get_all_objects', 'remove_whitespaces', 'to_lowercase', 'remove_actors',
+           'remove_verbs', 'StatementPipeline', 'count_interactions', 'create_barplot', 'subset_actor_verb',
+           'split_column', 'average_interactions']
 
 # %% ../nbs/01_input_csv.ipynb 4
 import pandas as pd
 import numpy as np
-from matplotlib import pyplot as plt
-import seaborn as sns
-from typing import Set, List, Union
+import re
+import json
+from typing import Set, List, Union, Iterable, Iterator
 from pathlib import Path
-from datetime import datetime
-from fastcore.test import *
+from .instrument import instrumented
 
-# %% ../nbs/01_input_csv.ipynb 10
+# %% ../nbs/01_input_csv.ipynb 12
 import ast
+def _to_dict(x):
+    try:
+        y = ast.literal_eval(x)
+        if type(y) == dict:
+            return y
+    except:
+        return None
+
+def _extract_value(x):
+    if x is None:
+        return x
+    if 'en-us' in x:
+        return x['en-us']
+    elif 'en-US' in x:
+        return x['en-US']
+    else:
+        return x
+
+_lang_map_re = re.compile(r"""^\{'(?:en-us|en-US)': (?:'([^'\\]*)'|"([^"\\]*)")\}$""")
+
+@instrumented
+def parse_language_map(s: pd.Series # Column whose values are language maps such as "{'en-US': 'Selected'}"
+                      ) -> pd.Series: # The column with the english value extracted from each language map
+    """
+    Extracts the english (*en-us* or *en-US*) value from a column of language maps stored as strings.
+    Each distinct string is parsed only once: the simple single-entry maps are matched with a regular expression,
+    all the others fall back to `ast.literal_eval`. Values which are not a dictionary become None
+    """
+    codes, uniques = pd.factorize(s)
+    parsed = np.empty(len(uniques) + 1, dtype=object)
+    for i, u in enumerate(uniques):
+        m = _lang_map_re.match(u) if isinstance(u, str) else None
+        if m is not None:
+            parsed[i] = m.group(1) if m.group(1) is not None else m.group(2)
+        else:
+            parsed[i] = _extract_value(_to_dict(u))
+    # missing values are coded as -1 and map to the trailing None
+    return pd.Series(parsed[codes], index=s.index, dtype=object)
+
+@instrumented
+def parse_timestamps(s: pd.Series # Column of ISO 8601 date strings, like *timestamp* or *stored*
+                    ) -> pd.Series: # The column converted to timezone-aware UTC datetimes
+    """
+    Converts a column of ISO 8601 strings to datetimes in UTC, parsing the whole column at once.
+    Fractional seconds can have any number of digits, and values that cannot be parsed become NaT
+    """
+    return pd.to_datetime(s, utc=True, format='ISO8601', errors='coerce')
+
+@instrumented
+def _normalize_statements(df: pd.DataFrame, # The statements as read from the csv file
+                          categorical: bool = False, # Whether actor, verb and object should be categorical columns
+                          results: bool = False # Whether the result column should be expanded with `parse_results`
+                         ) -> pd.DataFrame: # The statements with readable actor, verb and object columns
+    """
+    Renames, flattens and drops the columns of a freshly read dataframe (or chunk) of statements
+    """
+    if 'actor' not in df.columns and 'actor name' in df.columns:
+        df.rename(columns={"actor name": "actor"}, inplace=True)
+    if 'verb' not in df.columns and 'verb display' in df.columns:
+        df['verb'] = parse_language_map(df['verb display'])
+        df.drop(columns=['verb display'], inplace=True)
+    if 'object' not in df.columns and 'object name' in df.columns:
+        df['object'] = parse_language_map(df['object name'])
+        df.drop(columns=['object name'], inplace=True)
+    df.drop(columns=['lrs_id', 'verb id', 'object id'], inplace=True, errors='ignore')
+    for col in ['timestamp', 'stored']:
+        if col in df.columns:
+            df[col] = parse_timestamps(df[col])
+    if results and 'result' in df.columns:
+        parsed = parse_results(df['result'])
+        for col in parsed.columns:
+            df[col] = parsed[col]
+        df.attrs['result_errors'] = parsed.attrs['result_errors']
+    if categorical:
+        for col in ['actor', 'verb', 'object']:
+            if col in df.columns:
+                try:
+                    df[col] = df[col].astype('category')
+                except TypeError: # language maps without an english value cannot be used as categories
+                    pass
+    return df
+
+@instrumented
 def import_csv(csv_file: Union[str, Path], # Filename of the csv with the data
                index_col: int = 0, # The index column
                delimiter: str = ',', # the column delimiter
-               quotechar: str = '"'  # Quoting char. Ignore delimiter between this character
+               quotechar: str = '"',  # Quoting char. Ignore delimiter between this character
+               categorical: bool = False, # Store actor, verb and object as categorical columns
+               pipeline = None, # A `StatementPipeline` applied to the imported statements
+               results: bool = False # Expand the result column into typed columns with `parse_results`
               ) -> pd.DataFrame: # The imported dataframe with all the xAPI statements
     """
     Reads a csv file and perform some processing to make the data easier to read as well as
     easier to process afterwards. Returns a pandas Dataframe
     """
-    def to_dict(x):
-        try:
-            y = ast.literal_eval(x)
-            if type(y) == dict:
-                return y
-        except:
-            return None
-
-    def to_datetime(x):
-        try:
-            y = datetime.strptime(timestamp_str, "%Y-%m-%dT%H:%M:%S.%f%z")
-            return y
-        except:
-            return x
-        
-    def extract_value(x):
-        if x is None:
-            return x
-        if 'en-us' in x:
-            return x['en-us']
-        elif 'en-US' in x:
-            return x['en-US']
-        else:
-            return x
-    
     if not Path(csv_file).exists():
         print("The specified file does not exist. Creating an empty DataFrame...")
         return pd.DataFrame()
     else:
-        df = pd.read_csv(csv_file, index_col=index_col, delimiter=delimiter, quotechar=quotechar,
-                         converters = {'timestamp': to_datetime, 'verb display': to_dict, 'object name': to_dict})
+        df = pd.read_csv(csv_file, index_col=index_col, delimiter=delimiter, quotechar=quotechar)
         df = df.reset_index(drop=True)
-        if 'actor' not in df.columns and 'actor name' in df.columns:
-            df.rename(columns={"actor name": "actor"}, inplace=True)
-        if 'verb' not in df.columns and 'verb display' in df.columns:
-            df['verb'] = df['verb display'].map(extract_value)
-            df.drop(columns=['verb display'], inplace=True)
-        if 'object' not in df.columns and 'object name' in df.columns:
-            df['object'] = df['object name'].map(extract_value)
-            df.drop(columns=['object name'], inplace=True)
-        df.drop(columns=['lrs_id', 'verb id', 'object id'], inplace=True, errors='ignore')
-        return df
+        df = _normalize_statements(df, categorical, results)
+        return df if pipeline is None else pipeline(df)
 
 # %% ../nbs/01_input_csv.ipynb 20
-def get_all_verbs(df: pd.DataFrame # The dataset containing the xAPI statements (one statement per row)
+result_columns = ['score.raw', 'score.scaled', 'score.min', 'score.max', 'completion', 'success', 'duration']
+
+_duration_re = re.compile(r'P(?:([\d.]+)W)?(?:([\d.]+)D)?(?:T(?:([\d.]+)H)?(?:([\d.]+)M)?(?:([\d.]+)S)?)?')
+_duration_units = (604800, 86400, 3600, 60, 1)
+
+def _duration_seconds(duration) -> float:
+    "The number of seconds of an ISO 8601 duration"
+    m = _duration_re.fullmatch(duration) if isinstance(duration, str) else None
+    if m is None or not any(m.groups()):
+        raise ValueError(f"Invalid duration: {duration!r}")
+    return sum(float(v) * unit for v, unit in zip(m.groups(), _duration_units) if v)
+
+def _as_float(x) -> float:
+    if x is None: return np.nan
+    if isinstance(x, bool) or not isinstance(x, (int, float)):
+        raise ValueError(f"Not a number: {x!r}")
+    return float(x)
+
+def _as_bool(x):
+    if x is not None and not isinstance(x, bool):
+        raise ValueError(f"Not a boolean: {x!r}")
+    return x
+
+def _result_values(text: str) -> tuple:
+    "The values of `result_columns` for a single result"
+    r = json.loads(text)
+    if not isinstance(r, dict):
+        raise ValueError(f"Not a result: {text!r}")
+    score = r.get('score')
+    if score is None:
+        score = {}
+    elif not isinstance(score, dict):
+        raise ValueError(f"Not a score: {score!r}")
+    return (*(_as_float(score.get(k)) for k in ['raw', 'scaled', 'min', 'max']),
+            _as_bool(r.get('completion')), _as_bool(r.get('success')),
+            np.nan if r.get('duration') is None else _duration_seconds(r['duration']))
+
+@instrumented
+def parse_results(s: pd.Series # Column of json results, like *result*
+                 ) -> pd.DataFrame: # The typed fields of the results, one column for each of `result_columns`
+    """
+    Expands a column of json results into score, completion, success and duration columns, parsing each distinct
+    string only once. The number of rows that could not be parsed is stored in `attrs['result_errors']`
+    """
+    codes, uniques = pd.factorize(s)
+    missing = (np.nan,) * 4 + (None, None, np.nan)
+    values, errors = [], np.zeros(len(uniques), dtype=bool)
+    for i, text in enumerate(uniques):
+        try:
+            values.append(_result_values(text))
+        except (ValueError, TypeError):
+            values.append(missing)
+            errors[i] = True
+    # rows without a result have code -1, which picks the missing values appended at the end
+    values.append(missing)
+    columns = list(zip(*values))
+    df = pd.DataFrame({col: pd.array(columns[j], dtype='boolean' if col in ('completion', 'success') else 'float64')[codes]
+                       for j, col in enumerate(result_columns)}, index=s.index)
+    df.attrs['result_errors'] = int(np.bincount(codes[codes >= 0], minlength=len(uniques))[errors].sum())
+    return df
+
+# %% ../nbs/01_input_csv.ipynb 35
+@instrumented
+def import_csv_chunks(csv_file: Union[str, Path], # Filename of the csv with the data
+                      chunksize: int = 100_000, # The maximum number of rows in each chunk
+                      index_col: int = 0, # The index column
+                      delimiter: str = ',', # the column delimiter
+                      quotechar: str = '"',  # Quoting char. Ignore delimiter between this character
+                      categorical: bool = False, # Store actor, verb and object as categorical columns
+                      pipeline = None, # A `StatementPipeline` applied to each chunk
+                      results: bool = False # Expand the result column into typed columns with `parse_results`
+                     ) -> Iterator[pd.DataFrame]: # Iterator over the processed chunks of the file
+    """
+    Reads a csv file in chunks of at most `chunksize` rows, processing each chunk like `import_csv`.
+    If the file does not exist, no chunk is generated
+    """
+    if not Path(csv_file).exists():
+        print("The specified file does not exist. No chunks will be generated...")
+        return
+    start = 0
+    with pd.read_csv(csv_file, index_col=index_col, delimiter=delimiter, quotechar=quotechar,
+                     chunksize=chunksize) as reader:
+        for chunk in reader:
+            chunk.index = pd.RangeIndex(start, start + len(chunk))
+            start += len(chunk)
+            chunk = _normalize_statements(chunk, categorical, results)
+            yield chunk if pipeline is None else pipeline(chunk)
+
+# %% ../nbs/01_input_csv.ipynb 41
+def _iter_chunks(df: Union[pd.DataFrame, Iterable[pd.DataFrame]] # A dataframe or an iterable of chunks
+                ) -> Iterable[pd.DataFrame]: # An iterable of dataframes
+    "Wraps a single dataframe in a list, so that it can be processed like a sequence of chunks"
+    return [df] if isinstance(df, pd.DataFrame) else df
+
+def _is_query(df) -> bool:
+    "Whether the dataset is stored out of memory and answers the queries itself, like a `store.StatementQuery`"
+    return not isinstance(df, pd.DataFrame) and hasattr(df, 'count_interactions')
+
+def _unique_values(df: Union[pd.DataFrame, Iterable[pd.DataFrame]], # A dataframe or an iterable of chunks
+                   col: str # The column whose values are collected
+                  ) -> Set: # Set containing all the values of the column
+    "Collects the distinct values of a column, one chunk at a time"
+    values = set()
+    for chunk in _iter_chunks(df):
+        values.update(chunk[col].unique())
+    return values
+
+@instrumented
+def get_all_verbs(df: Union[pd.DataFrame, Iterable[pd.DataFrame]] # The dataset containing the xAPI statements (one statement per row), or an iterable of chunks
                  ) -> Set: # Set containing all the verbs occurring in the dataset
     """
     Returns a set with all verbs in the dataset
     """
-    return set(df["verb"].unique())
+    if _is_query(df): return df.get_all_verbs()
+    return _unique_values(df, "verb")
 
-# %% ../nbs/01_input_csv.ipynb 23
-def get_all_actors(df: pd.DataFrame # The dataset containing the xAPI statements (one statement per row)
+# %% ../nbs/01_input_csv.ipynb 45
+@instrumented
+def get_all_actors(df: Union[pd.DataFrame, Iterable[pd.DataFrame]] # The dataset containing the xAPI statements (one statement per row), or an iterable of chunks
                  ) -> Set: # Set containing all the actors occurring in the dataset
     """
     Returns a set with all actors in the dataset
     """
-    return set(df["actor"].unique())
+    if _is_query(df): return df.get_all_actors()
+    return _unique_values(df, "actor")
 
-# %% ../nbs/01_input_csv.ipynb 25
-def get_all_objects(df: pd.DataFrame # The dataset containing the xAPI statements (one statement per row)
+# %% ../nbs/01_input_csv.ipynb 47
+@instrumented
+def get_all_objects(df: Union[pd.DataFrame, Iterable[pd.DataFrame]] # The dataset containing the xAPI statements (one statement per row), or an iterable of chunks
                  ) -> Set: # Set containing all the objects occurring in the dataset
     """
     Returns a set with all objects in the dataset
     """
-    return set(df["object"].unique())
+    if _is_query(df): return df.get_all_objects()
+    return _unique_values(df, "object")
+
+# %% ../nbs/01_input_csv.ipynb 50
+def _map_categories(s: pd.Series, # A categorical column
+                    f # Function transforming the categories, as a Series
+                   ) -> pd.Series: # The categorical column with the transformed categories
+    "Applies `f` to the categories of `s` only, merging the categories that become equal"
+    new_codes, new_categories = pd.factorize(f(s.cat.categories.to_series()))
+    codes = s.cat.codes.to_numpy()
+    codes = np.where(codes >= 0, new_codes[codes], -1)
+    return pd.Series(pd.Categorical.from_codes(codes, categories=new_categories), index=s.index, name=s.name)
+
+def _map_strings(s: pd.Series, # A column of the dataset
+                 f # Function transforming a column of strings
+                ) -> pd.Series: # The transformed column
+    "Applies `f` to the column, or only to its categories for categorical columns"
+    return _map_categories(s, f) if isinstance(s.dtype, pd.CategoricalDtype) else f(s)
 
-# %% ../nbs/01_input_csv.ipynb 27
+@instrumented
 def remove_whitespaces(df: pd.DataFrame, # The dataset containing the xAPI statements (one statement per row)
                        cols: List # the columns on which whitespaces should be removed
                       ) -> pd.DataFrame: # The dataframe after applying the function
     """
     Removes whitespaces from the specified columns in the dataframe.
     """
-    df[cols] = df[cols].apply(lambda s : s.str.replace(" ", ""))
+    for col in cols:
+        df[col] = _map_strings(df[col], lambda s: s.str.replace(" ", ""))
     return df
 
-# %% ../nbs/01_input_csv.ipynb 28
+# %% ../nbs/01_input_csv.ipynb 51
+@instrumented
 def to_lowercase(df: pd.DataFrame, # The dataset containing the xAPI statements (one statement per row)
                        cols: List # the columns whose content should be made lowercase
                       ) -> pd.DataFrame: # The dataframe after applying the function
@@ -111,77 +294,246 @@ def to_lowercase(df: pd.DataFrame, # The dataset containing the xAPI statements
     Converts to lowercase the elements in the specified columns.
     The function only applies to columnns whose type is *str*
     """
-    df[cols] = df[cols].applymap(lambda s: s.lower() if type(s) == str else s)
+    for col in cols:
+        df[col] = _map_strings(df[col], lambda s: s.map(lambda x: x.lower() if type(x) == str else x))
     return df
 
-# %% ../nbs/01_input_csv.ipynb 31
+# %% ../nbs/01_input_csv.ipynb 55
+def _checked_index(df: pd.DataFrame, # The dataset containing the xAPI statements (one statement per row)
+                   index, # A `statement_index.StatementIndex` of the dataset, or None
+                   col: str # The column that should be indexed
+                  ):
+    "Returns `index` if it indexes `col`, otherwise None. Raises a `ValueError` if the index was built on another dataframe"
+    if index is None:
+        return None
+    if not index.is_valid(df):
+        raise ValueError("The StatementIndex was not built on this dataframe")
+    return index if col in index.cols else None
+
+def _remove_values(df: pd.DataFrame, col: str, values: List, index) -> pd.DataFrame:
+    idx = _checked_index(df, index, col)
+    if idx is None:
+        return df[~df[col].isin(values)]
+    keep = np.ones(len(df), dtype=bool)
+    keep[idx.positions(**{col: list(values)})] = False
+    return df[keep]
+
+@instrumented
 def remove_actors(df: pd.DataFrame, # The dataset containing the xAPI statements (one statement per row)
-                       cols: List # the list of actors to remove
+                       cols: List, # the list of actors to remove
+                       index = None # A `statement_index.StatementIndex` of `df`, used instead of comparing every row
                       ) -> pd.DataFrame: # The dataframe with the specified actors removed
     """
     Removes from the dataframe all the rows whose actor is in the specified list
     """
-    return df[~df['actor'].isin(cols)]
+    if _is_query(df): return df.remove_actors(cols)
+    return _remove_values(df, 'actor', cols, index)
 
-# %% ../nbs/01_input_csv.ipynb 33
+# %% ../nbs/01_input_csv.ipynb 57
+@instrumented
 def remove_verbs(df: pd.DataFrame, # The dataset containing the xAPI statements (one statement per row)
-                       cols: List # the list of verbs to remove
+                       cols: List, # the list of verbs to remove
+                       index = None # A `statement_index.StatementIndex` of `df`, used instead of comparing every row
                       ) -> pd.DataFrame: # The dataframe with the specified verbs removed
     """
     Removes from the dataframe all the rows whose actor is in the specified list
     """
-    return df[~df['verb'].isin(cols)]
+    if _is_query(df): return df.remove_verbs(cols)
+    return _remove_values(df, 'verb', cols, index)
+
+# %% ../nbs/01_input_csv.ipynb 60
+class StatementPipeline:
+    "Normalization and filtering steps applied to the statements in a single pass"
+    def __init__(self,
+                 whitespace_cols: List = None, # the columns on which whitespaces should be removed
+                 lowercase_cols: List = None, # the columns whose content should be made lowercase
+                 actors: List = None, # the list of actors to remove
+                 verbs: List = None # the list of verbs to remove
+                ):
+        self.whitespace_cols, self.lowercase_cols = list(whitespace_cols or []), list(lowercase_cols or [])
+        self.exclude = {col: list(values) for col, values in [('actor', actors), ('verb', verbs)] if values}
+
+    def _normalize(self, col: str, values: pd.Index) -> pd.Index:
+        "Applies the normalization steps of `col` to its distinct values"
+        if col in self.whitespace_cols:
+            values = values.map(lambda x: x.replace(" ", "") if type(x) == str else x)
+        if col in self.lowercase_cols:
+            values = values.map(lambda x: x.lower() if type(x) == str else x)
+        return values
+
+    @instrumented
+    def __call__(self, df: pd.DataFrame # The dataset containing the xAPI statements (one statement per row)
+                ) -> pd.DataFrame: # A new dataframe with the normalized and filtered statements
+        cols = set(self.whitespace_cols) | set(self.lowercase_cols) | set(self.exclude)
+        keep = np.ones(len(df), dtype=bool)
+        encoded = {}
+        for col in cols & set(df.columns):
+            s = df[col]
+            if col not in self.whitespace_cols and col not in self.lowercase_cols:
+                # the columns that are only filtered are copied as they are
+                keep &= ~s.isin(self.exclude[col]).to_numpy()
+                continue
+            if isinstance(s.dtype, pd.CategoricalDtype):
+                codes, values = s.cat.codes.to_numpy(), s.cat.categories
+            else:
+                codes, values = pd.factorize(s)
+            new_codes, values = pd.factorize(self._normalize(col, pd.Index(values, dtype=object)))
+            codes = np.where(codes >= 0, new_codes[codes], -1)
+            if col in self.exclude:
+                keep &= ~((codes >= 0) & values.isin(self.exclude[col])[codes])
+            encoded[col] = codes, values
+        index, data = df.index[keep], {}
+        for col in df.columns:
+            if col not in encoded:
+                data[col] = df[col][keep]
+                continue
+            codes, values = encoded[col]
+            if isinstance(df[col].dtype, pd.CategoricalDtype):
+                data[col] = pd.Series(pd.Categorical.from_codes(codes[keep], categories=values), index=index, name=col)
+            else: # missing values are coded as -1 and map to the trailing NaN
+                values = np.append(np.asarray(values, dtype=object), np.nan)[codes[keep]]
+                data[col] = pd.Series(values, index=index, name=col).astype(df[col].dtype)
+        return pd.DataFrame(data)
+
+    def __repr__(self):
+        return (f"StatementPipeline(whitespace_cols={self.whitespace_cols}, lowercase_cols={self.lowercase_cols}, "
+                f"actors={self.exclude.get('actor')}, verbs={self.exclude.get('verb')})")
+
+# %% ../nbs/01_input_csv.ipynb 68
+def _merge_partial(total, partial):
+    "Adds up two partial aggregates, indexed by the grouping values"
+    return partial if total is None else total.add(partial, fill_value=0)
 
-# %% ../nbs/01_input_csv.ipynb 38
-def count_interactions(df: pd.DataFrame, # The dataset containing the xAPI statements (one statement per row)
+def _count_partial(df: pd.DataFrame) -> pd.Series:
+    return df.groupby(['actor'], observed=True)["verb"].count()
+
+def _count_result(counts: pd.Series) -> pd.DataFrame:
+    if counts is None:
+        return pd.DataFrame(columns=['actor', 'count'])
+    tmp = counts.astype('int64').sort_index().to_frame('count').sort_values("count")
+    tmp.reset_index(inplace=True)
+    return tmp
+
+@instrumented
+def count_interactions(df: Union[pd.DataFrame, Iterable[pd.DataFrame]], # The dataset containing the xAPI statements (one statement per row), or an iterable of chunks
                     ) -> pd.DataFrame: # A dataframe with the number of interactions of each actor
     """
     Creates a new dataframe counting the total number of statements associated to each actor
     """
-    tmp = df.groupby(['actor'])["verb"].agg(['count']).sort_values("count")
-    tmp.reset_index(inplace=True)
-    return tmp
+    if _is_query(df): return df.count_interactions()
+    counts = None
+    for chunk in _iter_chunks(df):
+        counts = _merge_partial(counts, _count_partial(chunk))
+    return _count_result(counts)
 
-# %% ../nbs/01_input_csv.ipynb 41
+# %% ../nbs/01_input_csv.ipynb 74
+@instrumented
 def create_barplot(df: pd.DataFrame, # The input dataset
                     x: str, # the column with the numerical variable to be plotted
                     y: str, # the column with the name associated to each value 
-                    cmap: str = 'flare' # the color palette to be used
+                    cmap: str = 'flare', # the color palette to be used
+                    top: int = None, # if given, only the `top` largest bars are drawn, followed by a bar aggregating all the others
+                    agg: str = None, # how the values of `x` are aggregated for repeated names and for the bar of the others, 'sum' for counts and 'mean' otherwise
+                    other: str = 'others', # the name of the bar aggregating the values not in the `top`
+                    ax = None, # the matplotlib axes to draw on, a new figure if `path` is given, otherwise the current axes
+                    path: Union[str, Path] = None # if given, the plot is saved in this file
                   ):
     """
     Creates an horizontal barplot of the data in the dataframe
     """
-    sns.barplot(x=x, y=y, data=df, palette=cmap)
+    import seaborn as sns
+    if agg is None:
+        agg = 'sum' if x == 'count' or x not in df.columns else 'mean'
+    if x not in df.columns:
+        # raw statements: the bars are the number of rows of each name
+        values, agg = df[y].value_counts(sort=False).rename(x), 'sum'
+    elif top is not None or df[y].duplicated().any():
+        values = df.groupby(y, observed=True, sort=False)[x].agg(agg)
+    else:
+        values = None
+    if values is not None:
+        if top is not None and len(values) > top:
+            largest = values.nlargest(top)
+            # the others are aggregated from their rows, e.g. their mean is not the mean of the means of each name
+            tail = (df.loc[~df[y].isin(largest.index), x] if x in df.columns else values.drop(largest.index)).agg(agg)
+            values = pd.concat([largest.set_axis(largest.index.astype(object)), pd.Series({other: tail})])
+        df = values.rename_axis(y).rename(x).reset_index()
+    if ax is None and path is not None:
+        # a figure not managed by pyplot is rendered with the Agg backend, without a display
+        from matplotlib.figure import Figure
+        ax = Figure(figsize=(6.4, max(4.8, 0.25 * len(df)))).subplots()
+    # the bars are already aggregated, so seaborn does not need to compute confidence intervals
+    ax = sns.barplot(x=x, y=y, data=df, palette=cmap, errorbar=None, ax=ax)
+    if path is not None:
+        ax.figure.savefig(path, bbox_inches='tight')
+    return ax
 
-# %% ../nbs/01_input_csv.ipynb 44
+# %% ../nbs/01_input_csv.ipynb 79
+@instrumented
 def subset_actor_verb(df: pd.DataFrame, # The dataset containing the xAPI statements (one statement per row)
                       actor: str, # The actor we are interested in
-                      verb: str # The verb we are interested in
+                      verb: str, # The verb we are interested in
+                      index = None # A `statement_index.StatementIndex` of `df`, used instead of comparing every row
                     ) -> pd.DataFrame: # A dataframe containing only the statements with a specific actor and verb
     """
     Returns the subset of the original dataframe containing only statements with the specified actor and verb
     """
+    if _is_query(df): return df.subset_actor_verb(actor, verb)
+    idx = _checked_index(df, index, 'actor')
+    if idx is not None and 'verb' in idx.cols:
+        return df.iloc[idx.positions(actor=actor, verb=verb)]
     return df[(df["actor"]==actor) & (df["verb"]==verb)]
 
-# %% ../nbs/01_input_csv.ipynb 47
+# %% ../nbs/01_input_csv.ipynb 83
+@instrumented
 def split_column(df: pd.DataFrame, # The dataset containing the xAPI statements (one statement per row)
                  col: str, # The column in the dataset that should be split into multiple columns
                  col_names: List, # The names of the columns created after split
                  sep: str =';', # The separator between fiels inside the column we want to split
+                 categorical: bool = False, # Store the new columns as categorical columns
+                 flag: str = None # If given, the name of a boolean column marking the rows that do not have `len(col_names)` fields
                 ) -> pd.DataFrame: # A dataframe with the content *col* cplit into several columns 
     """
-    Splits the column of the DataFrame into multiple columns, and return a new data
+    Splits the column of the DataFrame into multiple columns, and return a new data.
+    Each distinct value is split only once, into at most `len(col_names)` fields: rows with fewer fields
+    have missing values in the last columns, rows with more fields keep the remaining separators in the last column.
+    The number of such rows is stored in `attrs['split_mismatches']`
     """
-    new_df = df[col].str.split(sep, expand=True)
-    if len(new_df.columns) == len(col_names):
-        new_df.columns = col_names
-        return new_df
-    else:
-        print("The length of col_names should match the number of generated columns")
-        return pd.DataFrame()
+    n = len(col_names)
+    codes, uniques = pd.factorize(df[col])
+    uniques = pd.Series(np.asarray(uniques, dtype=object), dtype=object)
+    parts = uniques.str.split(sep, n=n - 1, regex=False)
+    # the rows missing the value (code -1) take the last element, appended to each array of the distinct values
+    mismatched = np.append((uniques.str.count(re.escape(sep)) != n - 1).to_numpy(), True)[codes]
+    data = {}
+    for name, j in zip(col_names, range(n)):
+        field = parts.str.get(j)
+        if categorical:
+            field_codes, categories = pd.factorize(field)
+            data[name] = pd.Categorical.from_codes(np.append(field_codes, -1)[codes], categories=categories)
+        else:
+            data[name] = np.append(field.to_numpy(dtype=object), np.nan)[codes]
+    new_df = pd.DataFrame(data, index=df.index)
+    if not categorical and isinstance(df[col].dtype, pd.StringDtype):
+        # keep the same string storage of the input, e.g. Arrow-backed strings
+        new_df = new_df.astype(df[col].dtype)
+    if flag is not None:
+        new_df[flag] = mismatched
+    new_df.attrs['split_mismatches'] = int(mismatched.sum())
+    return new_df
+
+# %% ../nbs/01_input_csv.ipynb 87
+def _average_partial(df: pd.DataFrame, avg_col: str, user_col: str) -> pd.DataFrame:
+    return df.groupby(user_col, observed=True)[avg_col].agg(['sum', 'count'])
 
-# %% ../nbs/01_input_csv.ipynb 49
-def average_interactions(df: pd.DataFrame, # The dataset containing the xAPI statements (one statement per row)
+def _average_result(totals: pd.DataFrame, avg_col: str, user_col: str) -> pd.DataFrame:
+    if totals is None:
+        return pd.DataFrame(columns=[user_col, avg_col])
+    totals = totals.sort_index()
+    return (totals['sum'] / totals['count']).rename(avg_col).reset_index().sort_values(avg_col)
+
+@instrumented
+def average_interactions(df: Union[pd.DataFrame, Iterable[pd.DataFrame]], # The dataset containing the xAPI statements (one statement per row), or an iterable of chunks
                          avg_col: str, # The column on which to compute average
                          user_col: str = 'actor' # The column to groupby (usually **actor**)
                     ) -> pd.DataFrame: # A new dataframe with the average of the interaction per specific value
@@ -189,5 +541,10 @@ def average_interactions(df: pd.DataFrame, # The dataset containing the xAPI sta
     Similar to `count_interactions`, but here creates a new dataframe averaging the statements
     associated to a specific column
     """
-    new_df = df.groupby(user_col, as_index=False)[avg_col].mean().sort_values(avg_col)
-    return new_df
+    if _is_query(df): return df.average_interactions(avg_col, user_col)
+    if isinstance(df, pd.DataFrame):
+        return df.groupby(user_col, as_index=False, observed=True)[avg_col].mean().sort_values(avg_col)
+    totals = None
+    for chunk in df:
+        totals = _merge_partial(totals, _average_partial(chunk, avg_col, user_col))
+    return _average_result(totals, avg_col, user_col)
@@ -1,35 +1,64 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/00_input_json.ipynb.
 
 # %% auto 0
-__all__ = ['load_statement', 'pretty_print_statement', 'get_value', 'get_actor', 'get_actor_name', 'get_verb', 'get_verb_str',
-           'get_object', 'get_object_definition', 'get_object_description', 'get_stored', 'get_timestamp',
-           'get_time_diff', 'is_active', 'is_voided', 'has_generated_id', 'get_client', 'get_LRS', 'get_id',
-           'get_persona_id', 'get_organisation', 'get_hash', 'get_completed_fw_queues', 'get_failed_fw_log',
-           'get_completed_queues', 'get_dead_forwarding_queues', 'get_pending_forwarding_queues',
-           'get_processing_queues', 'get_registrations']
+__all__ = ['json_backends', 'json_backend', 'statement_columns', 'load_statement', 'pretty_print_statement', 'get_value',
+           'get_actor', 'get_actor_name', 'get_verb', 'get_verb_str', 'get_object', 'get_object_definition',
+           'get_object_description', 'get_stored', 'get_timestamp', 'get_time_diff', 'is_active', 'is_voided',
+           'has_generated_id', 'get_client', 'get_LRS', 'get_id', 'get_persona_id', 'get_organisation', 'get_hash',
+           'get_completed_fw_queues', 'get_failed_fw_log', 'get_completed_queues', 'get_dead_forwarding_queues',
+           'get_pending_forwarding_queues', 'get_processing_queues', 'get_registrations', 'iter_statements',
+           'statements_to_dataframe', 'load_statements', 'load_statements_chunks', 'FieldExtractor']
 
 # %% ../nbs/00_input_json.ipynb 4
 import json
-from typing import Union, List
+import re
+from typing import Union, List, Iterator, Iterable, Dict, Sequence, Any
 from datetime import datetime, timedelta
 from pathlib import Path
-from fastcore.test import *
+from .instrument import instrumented
+
+# %% ../nbs/00_input_json.ipynb 6
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# every digit is translated to 0, so that a run of 19 digits is found with a fast substring search
+_digits_to_zero, _long_number = bytes.maketrans(b'123456789', b'000000000'), b'0' * 19
+
+def _exact_loads(loads):
+    "Wraps a json parser, so that the documents it cannot parse exactly are parsed by the standard library"
+    def _loads(data: Union[bytes, str]):
+        if isinstance(data, str): data = data.encode()
+        if _long_number in data.translate(_digits_to_zero):
+            return json.loads(data)
+        try:
+            return loads(data)
+        except ValueError:
+            return json.loads(data)
+    return _loads
+
+json_backends = {'json': json.loads}
+if orjson is not None:
+    json_backends['orjson'] = _exact_loads(orjson.loads)
+json_backend = 'orjson' if orjson is not None else 'json'
 
-# %% ../nbs/00_input_json.ipynb 8
-def load_statement(json_file: str # Filename of the json containing the statement
+# %% ../nbs/00_input_json.ipynb 10
+@instrumented
+def load_statement(json_file: str, # Filename of the json containing the statement
+                   backend: str = None # The json parser from `json_backends`, `json_backend` if not given
                   ) -> dict: # A dictionary representing the statement structure
     """
     Load a json from file and store the information in a Python dictionary object.
     If the file does not exist, returns an empty dict and print an error message
     """
     if Path(json_file).exists():
-        with open(json_file) as f:
-            return json.load(f)
+        return json_backends[backend or json_backend](Path(json_file).read_bytes())
     else:
         print("ERROR: The specified file does not exist")
         return dict()
 
-# %% ../nbs/00_input_json.ipynb 10
+# %% ../nbs/00_input_json.ipynb 12
 def pretty_print_statement(statement: dict, # the statement dict imported from JSON
                           indent: int=4 # indentation used when printing
                           ) -> None:
@@ -38,7 +67,7 @@ def pretty_print_statement(statement: dict, # the statement dict imported from J
     """
     print(json.dumps(statement, indent=indent))
 
-# %% ../nbs/00_input_json.ipynb 12
+# %% ../nbs/00_input_json.ipynb 14
 def get_value(statement: dict, # Our xAPI statement imported from JSON
               key: str # The key we are interested in
              ) -> Union[str, dict, List, None]: # The value associated to the key in the statement
@@ -51,7 +80,7 @@ def get_value(statement: dict, # Our xAPI statement imported from JSON
     else:
         return None
 
-# %% ../nbs/00_input_json.ipynb 15
+# %% ../nbs/00_input_json.ipynb 17
 def get_actor(statement: dict, # Our xAPI statement imported from JSON
              ) -> dict: # dictionary containing actor information
     """
@@ -61,7 +90,7 @@ def get_actor(statement: dict, # Our xAPI statement imported from JSON
     #pretty_print_statement(st["actor"], indent = 2)
     return st["actor"]
 
-# %% ../nbs/00_input_json.ipynb 17
+# %% ../nbs/00_input_json.ipynb 19
 def get_actor_name(statement: dict, # Our xAPI statement imported from JSON
              ) -> str: # name of the actor
     """
@@ -70,7 +99,7 @@ def get_actor_name(statement: dict, # Our xAPI statement imported from JSON
     st = get_value(statement, "statement")
     return st["actor"]["name"]
 
-# %% ../nbs/00_input_json.ipynb 19
+# %% ../nbs/00_input_json.ipynb 21
 def get_verb(statement: dict, # Our xAPI statement imported from JSON
              ) -> dict: # dictionary containing verb information
     """
@@ -79,7 +108,7 @@ def get_verb(statement: dict, # Our xAPI statement imported from JSON
     st = get_value(statement, "statement")
     return st["verb"]
 
-# %% ../nbs/00_input_json.ipynb 21
+# %% ../nbs/00_input_json.ipynb 23
 def get_verb_str(statement: dict, # Our xAPI statement imported from JSON
              ) -> str: # the displayed verb
     """
@@ -88,7 +117,7 @@ def get_verb_str(statement: dict, # Our xAPI statement imported from JSON
     st = get_value(statement, "statement")
     return st["verb"]["display"]["en-US"]
 
-# %% ../nbs/00_input_json.ipynb 23
+# %% ../nbs/00_input_json.ipynb 25
 def get_object(statement: dict, # Our xAPI statement imported from JSON
              ) -> dict: # dictionary containing object information
     """
@@ -97,7 +126,7 @@ def get_object(statement: dict, # Our xAPI statement imported from JSON
     st = get_value(statement, "statement")
     return st["object"]
 
-# %% ../nbs/00_input_json.ipynb 25
+# %% ../nbs/00_input_json.ipynb 27
 def get_object_definition(statement: dict, # Our xAPI statement imported from JSON
              ) -> str: # the object definition
     """
@@ -106,7 +135,7 @@ def get_object_definition(statement: dict, # Our xAPI statement imported from JS
     st = get_value(statement, "statement")
     return st["object"]["definition"]["name"]["en-US"]
 
-# %% ../nbs/00_input_json.ipynb 27
+# %% ../nbs/00_input_json.ipynb 29
 def get_object_description(statement: dict, # Our xAPI statement imported from JSON
              ) -> str: # the object description
     """
@@ -115,7 +144,7 @@ def get_object_description(statement: dict, # Our xAPI statement imported from J
     st = get_value(statement, "statement")
     return st["object"]["definition"]["description"]["en-US"]
 
-# %% ../nbs/00_input_json.ipynb 31
+# %% ../nbs/00_input_json.ipynb 33
 def get_stored(statement: dict, # Our xAPI statement imported from JSON
               ) -> datetime: # datetime object representing the time the statement was stored in the database
     """
@@ -124,7 +153,7 @@ def get_stored(statement: dict, # Our xAPI statement imported from JSON
     stored_str = get_value(statement, "stored")
     return datetime.strptime(stored_str, "%Y-%m-%dT%H:%M:%S.%f%z")
 
-# %% ../nbs/00_input_json.ipynb 33
+# %% ../nbs/00_input_json.ipynb 35
 def get_timestamp(statement: dict, # Our xAPI statement imported from JSON
               ) -> datetime: # datetime object representing the time the statement was generated
     """
@@ -133,7 +162,7 @@ def get_timestamp(statement: dict, # Our xAPI statement imported from JSON
     timestamp_str = get_value(statement, "timestamp")
     return datetime.strptime(timestamp_str, "%Y-%m-%dT%H:%M:%S.%f%z")
 
-# %% ../nbs/00_input_json.ipynb 35
+# %% ../nbs/00_input_json.ipynb 37
 def get_time_diff(statement: dict, # Our xAPI statement imported from JSON
                  ) -> timedelta:   # Time difference between when the statement was sent and when it was stored
     """
@@ -143,7 +172,7 @@ def get_time_diff(statement: dict, # Our xAPI statement imported from JSON
     ts_stored = get_stored(statement)
     return ts_stored - ts_sent
 
-# %% ../nbs/00_input_json.ipynb 38
+# %% ../nbs/00_input_json.ipynb 40
 def is_active(statement: dict, # Our xAPI statement imported from JSON
               ) -> bool: # Boolean representive whether active or not
     """
@@ -151,7 +180,7 @@ def is_active(statement: dict, # Our xAPI statement imported from JSON
     """
     return get_value(statement, "active")
 
-# %% ../nbs/00_input_json.ipynb 40
+# %% ../nbs/00_input_json.ipynb 42
 def is_voided(statement: dict, # Our xAPI statement imported from JSON
               ) -> bool: # Boolean representive whether statement is voided or not
     """
@@ -159,7 +188,7 @@ def is_voided(statement: dict, # Our xAPI statement imported from JSON
     """
     return get_value(statement, "voided")
 
-# %% ../nbs/00_input_json.ipynb 42
+# %% ../nbs/00_input_json.ipynb 44
 def has_generated_id(statement: dict, # Our xAPI statement imported from JSON
               ) -> bool: # Boolean representive whether statement has generated id
     """
@@ -167,7 +196,7 @@ def has_generated_id(statement: dict, # Our xAPI statement imported from JSON
     """
     return get_value(statement, "hasGeneratedId")
 
-# %% ../nbs/00_input_json.ipynb 45
+# %% ../nbs/00_input_json.ipynb 47
 def get_client(statement: dict, # Our xAPI statement imported from JSON
               ) -> str: # ID of the client
     """
@@ -175,7 +204,7 @@ def get_client(statement: dict, # Our xAPI statement imported from JSON
     """
     return get_value(statement, "client")
 
-# %% ../nbs/00_input_json.ipynb 47
+# %% ../nbs/00_input_json.ipynb 49
 def get_LRS(statement: dict, # Our xAPI statement imported from JSON
               ) -> str: # ID of the Learning Record Store
     """
@@ -183,7 +212,7 @@ def get_LRS(statement: dict, # Our xAPI statement imported from JSON
     """
     return get_value(statement, "lrs_id")
 
-# %% ../nbs/00_input_json.ipynb 49
+# %% ../nbs/00_input_json.ipynb 51
 def get_id(statement: dict, # Our xAPI statement imported from JSON
               ) -> str: # ID of the statement
     """
@@ -191,7 +220,7 @@ def get_id(statement: dict, # Our xAPI statement imported from JSON
     """
     return get_value(statement, "_id")
 
-# %% ../nbs/00_input_json.ipynb 51
+# %% ../nbs/00_input_json.ipynb 53
 def get_persona_id(statement: dict, # Our xAPI statement imported from JSON
               ) -> str: # id of the persona associated to the statement
     """
@@ -199,7 +228,7 @@ def get_persona_id(statement: dict, # Our xAPI statement imported from JSON
     """
     return get_value(statement, "personaIdentifier")
 
-# %% ../nbs/00_input_json.ipynb 53
+# %% ../nbs/00_input_json.ipynb 55
 def get_organisation(statement: dict, # Our xAPI statement imported from JSON
               ) -> str: # id of the organization to the statement
     """
@@ -207,7 +236,7 @@ def get_organisation(statement: dict, # Our xAPI statement imported from JSON
     """
     return get_value(statement, "organisation")
 
-# %% ../nbs/00_input_json.ipynb 55
+# %% ../nbs/00_input_json.ipynb 57
 def get_hash(statement: dict, # Our xAPI statement imported from JSON
               ) -> str: # hash of the statement
     """
@@ -215,7 +244,7 @@ def get_hash(statement: dict, # Our xAPI statement imported from JSON
     """
     return get_value(statement, "hash")
 
-# %% ../nbs/00_input_json.ipynb 58
+# %% ../nbs/00_input_json.ipynb 60
 def get_completed_fw_queues(statement: dict, # Our xAPI statement imported from JSON
                 ) -> List: # List of completed forwarding queues in the statement
     """
@@ -223,7 +252,7 @@ def get_completed_fw_queues(statement: dict, # Our xAPI statement imported from
     """
     return get_value(statement, "completedForwardingQueue")
 
-# %% ../nbs/00_input_json.ipynb 60
+# %% ../nbs/00_input_json.ipynb 62
 def get_failed_fw_log(statement: dict, # Our xAPI statement imported from JSON
                 ) -> List: # List of failed forwarding log messages in the statement
     """
@@ -231,7 +260,7 @@ def get_failed_fw_log(statement: dict, # Our xAPI statement imported from JSON
     """
     return get_value(statement, "failedForwardingLog")
 
-# %% ../nbs/00_input_json.ipynb 62
+# %% ../nbs/00_input_json.ipynb 64
 def get_completed_queues(statement: dict, # Our xAPI statement imported from JSON
                 ) -> List: # List of completed queues in the statement
     """
@@ -239,7 +268,7 @@ def get_completed_queues(statement: dict, # Our xAPI statement imported from JSO
     """
     return get_value(statement, "completedQueues")
 
-# %% ../nbs/00_input_json.ipynb 64
+# %% ../nbs/00_input_json.ipynb 66
 def get_completed_queues(statement: dict, # Our xAPI statement imported from JSON
                 ) -> List: # List of completed queues in the statement
     """
@@ -247,7 +276,7 @@ def get_completed_queues(statement: dict, # Our xAPI statement imported from JSO
     """
     return get_value(statement, "completedQueues")
 
-# %% ../nbs/00_input_json.ipynb 66
+# %% ../nbs/00_input_json.ipynb 68
 def get_dead_forwarding_queues(statement: dict, # Our xAPI statement imported from JSON
                 ) -> List: # List of dead forwarding queues in the statement
     """
@@ -255,7 +284,7 @@ def get_dead_forwarding_queues(statement: dict, # Our xAPI statement imported fr
     """
     return get_value(statement, "deadForwardingQueue")
 
-# %% ../nbs/00_input_json.ipynb 68
+# %% ../nbs/00_input_json.ipynb 70
 def get_pending_forwarding_queues(statement: dict, # Our xAPI statement imported from JSON
                 ) -> List: # List of completed queues in the statement
     """
@@ -263,7 +292,7 @@ def get_pending_forwarding_queues(statement: dict, # Our xAPI statement imported
     """
     return get_value(statement, "pendingForwardingQueue")
 
-# %% ../nbs/00_input_json.ipynb 70
+# %% ../nbs/00_input_json.ipynb 72
 def get_processing_queues(statement: dict, # Our xAPI statement imported from JSON
                 ) -> List: # List of processing queues in the statement
     """
@@ -271,10 +300,227 @@ def get_processing_queues(statement: dict, # Our xAPI statement imported from JS
     """
     return get_value(statement, "processingQueues")
 
-# %% ../nbs/00_input_json.ipynb 72
+# %% ../nbs/00_input_json.ipynb 74
 def get_registrations(statement: dict, # Our xAPI statement imported from JSON
                 ) -> List: # List of registrations in the statement
     """
     Extract the List of registrations in the statement
     """
     return get_value(statement, "registrations")
+
+# %% ../nbs/00_input_json.ipynb 77
+_separators_re = re.compile(r'[\s\[\],]*')
+
+@instrumented
+def iter_statements(json_file: Union[str, Path], # Filename of the json array or newline-delimited json with the statements
+                    buffer_size: int = 1 << 20, # Number of characters read from the file at a time
+                    keys: Iterable[str] = None, # If given, only these keys are kept in every decoded object
+                    backend: str = None # The json parser from `json_backends`, `json_backend` if not given
+                   ) -> Iterator[dict]: # Iterator over the statements in the file
+    """
+    Stream the statements stored in a file, one dictionary at a time. The file can contain a json array
+    of statements or one statement per line. If the file does not exist, prints an error message and
+    no statement is generated
+    """
+    if not Path(json_file).exists():
+        print("ERROR: The specified file does not exist")
+        return
+    loads = json_backends[backend or json_backend]
+    if keys is None and loads is not json.loads:
+        with open(json_file, 'rb') as f:
+            line = f.readline()
+            while line.isspace(): line = f.readline()
+            try:
+                first = loads(line)
+            except ValueError:
+                first = None
+            # newline-delimited json is parsed one line at a time, anything else falls back to the standard library
+            if isinstance(first, dict):
+                yield first
+                for line in f:
+                    if line.isspace(): continue
+                    yield loads(line)
+                return
+    if keys is None: decoder = json.JSONDecoder()
+    else:
+        keys = frozenset(keys)
+        # the nested objects are pruned as soon as they are decoded, so the full statement is never built
+        decoder = json.JSONDecoder(object_pairs_hook=lambda pairs: {k: v for k, v in pairs if k in keys})
+    with open(json_file) as f:
+        buf, pos, eof = '', 0, False
+        while True:
+            pos = _separators_re.match(buf, pos).end()
+            if pos < len(buf):
+                try:
+                    statement, pos = decoder.raw_decode(buf, pos)
+                    yield statement
+                    continue
+                except json.JSONDecodeError:
+                    # the statement is truncated at the end of the buffer, unless the whole file was read
+                    if eof: raise
+            elif eof:
+                return
+            data = f.read(buffer_size)
+            eof = not data
+            buf, pos = buf[pos:] + data, 0
+
+# %% ../nbs/00_input_json.ipynb 83
+statement_columns = ['timestamp', 'stored', 'actor', 'verb', 'object', 'object description', 'result',
+                     'voided', 'active', 'client', 'lrs_id', 'hash']
+
+def _english(lang_map):
+    if not isinstance(lang_map, dict):
+        return lang_map
+    if 'en-us' in lang_map:
+        return lang_map['en-us']
+    elif 'en-US' in lang_map:
+        return lang_map['en-US']
+    else:
+        return lang_map
+
+def _project_statement(statement: dict # Our xAPI statement imported from JSON
+                      ) -> tuple: # The values of `statement_columns` for the statement
+    # statements exported from Learning Locker wrap the xAPI statement, statements from the xAPI API do not
+    st = statement.get("statement", statement)
+    obj_def = (st.get("object") or {}).get("definition") or {}
+    result = st.get("result")
+    return (statement.get("timestamp", st.get("timestamp")),
+            statement.get("stored", st.get("stored")),
+            (st.get("actor") or {}).get("name"),
+            _english((st.get("verb") or {}).get("display")),
+            _english(obj_def.get("name")),
+            _english(obj_def.get("description")),
+            None if result is None else json.dumps(result, separators=(',', ':')),
+            statement.get("voided"),
+            statement.get("active"),
+            statement.get("client"),
+            statement.get("lrs_id"),
+            statement.get("hash"))
+
+@instrumented
+def statements_to_dataframe(statements: Iterable[dict] # The statements, as dictionaries imported from JSON
+                           ) -> 'pd.DataFrame': # A dataframe with one statement per row
+    """
+    Collects the most relevant fields of the statements into the columns of a DataFrame
+    """
+    import pandas as pd
+    from xapi_analysis.input_csv import parse_timestamps
+    df = pd.DataFrame.from_records((_project_statement(s) for s in statements), columns=statement_columns)
+    for col in ['timestamp', 'stored']:
+        df[col] = parse_timestamps(df[col])
+    return df
+
+# %% ../nbs/00_input_json.ipynb 84
+@instrumented
+def load_statements(json_file: Union[str, Path], # Filename of the json array or newline-delimited json with the statements
+                    backend: str = None # The json parser from `json_backends`, `json_backend` if not given
+                   ) -> 'pd.DataFrame': # A dataframe with one statement per row
+    """
+    Load all the statements stored in a file into a DataFrame with the same schema used for the ```csv``` files
+    """
+    return statements_to_dataframe(iter_statements(json_file, backend=backend))
+
+@instrumented
+def load_statements_chunks(json_file: Union[str, Path], # Filename of the json array or newline-delimited json with the statements
+                           chunksize: int = 100_000, # The maximum number of statements in each chunk
+                           backend: str = None # The json parser from `json_backends`, `json_backend` if not given
+                          ) -> Iterator['pd.DataFrame']: # Iterator over dataframes with one statement per row
+    """
+    Like `load_statements`, but generates DataFrames of at most `chunksize` statements, with rows numbered
+    consecutively across chunks
+    """
+    start, batch = 0, []
+    for statement in iter_statements(json_file, backend=backend):
+        batch.append(statement)
+        if len(batch) == chunksize:
+            df = statements_to_dataframe(batch)
+            df.index = range(start, start + len(df))
+            start, batch = start + len(df), []
+            yield df
+    if batch:
+        df = statements_to_dataframe(batch)
+        df.index = range(start, start + len(df))
+        yield df
+
+# %% ../nbs/00_input_json.ipynb 89
+def _pick_language(lang_map, languages: Sequence[str]):
+    "The value of the first preferred language in the language map, otherwise the first value available"
+    if not isinstance(lang_map, dict):
+        return lang_map
+    for lang in languages:
+        if lang in lang_map:
+            return lang_map[lang]
+    return next(iter(lang_map.values()), None)
+
+def _paths_source(tree: dict, var: str, depth: int = 1) -> List[str]:
+    "The source code that reads all the paths in the tree from the dictionary in `var`"
+    pad, lines = '    ' * depth, []
+    for j, (key, (plain, lang, sub)) in enumerate(tree.items()):
+        node = f"{var}_{j}"
+        lines.append(f"{pad}{node} = {var}.get({key!r})")
+        lines.append(f"{pad}if {node} is not None:")
+        lines += [f"{pad}    v{i} = {node}" for i in plain]
+        lines += [f"{pad}    v{i} = pick({node}, languages)" for i in lang]
+        if sub:
+            lines.append(f"{pad}    if isinstance({node}, dict):")
+            lines += _paths_source(sub, node, depth + 2)
+        if not (plain or lang or sub): lines.append(f"{pad}    pass")
+    return lines
+
+def _compile_paths(tree: dict, n: int, languages: Sequence[str]):
+    "Builds a function returning the list of values of the `n` paths in the tree, or `None` for missing paths"
+    values = ', '.join(f"v{i}" for i in range(n))
+    source = '\n'.join([f"def extract(d):", f"    {values} = {', '.join(['None'] * n)}"] +
+                       _paths_source(tree, 'd') + [f"    return [{values}]"])
+    namespace = {'pick': _pick_language, 'languages': tuple(languages)}
+    exec(source, namespace)
+    return namespace['extract']
+
+# %% ../nbs/00_input_json.ipynb 90
+class FieldExtractor:
+    """
+    Extracts a set of fields, given by their paths, from statements with a single traversal per statement
+    """
+    def __init__(self,
+                 fields: Dict[str, str], # The name of each field mapped to its path, e.g. `{'verb': 'statement.verb.display.*'}`
+                 defaults: Dict[str, Any] = None, # The value of the fields that are missing in a statement, `None` if not given
+                 languages: Sequence[str] = ('en-US', 'en-us') # The preferred languages, in order, for the language maps
+                ):
+        self.names = list(fields)
+        defaults = defaults or {}
+        self.defaults = [defaults.get(name) for name in self.names]
+        tree = {}
+        for i, path in enumerate(fields.values()):
+            keys = path.split('.')
+            is_lang = keys[-1] == '*'
+            if is_lang: keys = keys[:-1]
+            node = tree
+            for key in keys[:-1]:
+                node = node.setdefault(key, ([], [], {}))[2]
+            node.setdefault(keys[-1], ([], [], {}))[1 if is_lang else 0].append(i)
+        # the paths are turned into the code of a function with nested lookups, which is then compiled
+        self._extract = _compile_paths(tree, len(self.names), languages)
+        self._missing = [i for i, default in enumerate(self.defaults) if default is not None]
+
+    def values(self, statement: dict # Our xAPI statement imported from JSON
+              ) -> list: # The values of the fields, in the order they were declared
+        values = self._extract(statement)
+        for i in self._missing:
+            if values[i] is None: values[i] = self.defaults[i]
+        return values
+
+    def __call__(self, statement: dict # Our xAPI statement imported from JSON
+                ) -> dict: # The name of each field mapped to its value in the statement
+        return dict(zip(self.names, self.values(statement)))
+
+    @instrumented
+    def records(self, statements: Iterable[dict] # The statements, e.g. from `iter_statements`
+               ) -> Iterator[list]: # The values of the fields for each statement
+        for statement in statements:
+            yield self.values(statement)
+
+    @instrumented
+    def dataframe(self, statements: Iterable[dict] # The statements, e.g. from `iter_statements`
+                 ) -> 'pd.DataFrame': # A dataframe with one column per field and one row per statement
+        import pandas as pd
+        return pd.DataFrame.from_records(self.records(statements), columns=self.names)
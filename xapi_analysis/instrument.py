@@ -0,0 +1,245 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/14_instrument.ipynb.
+
+# %% auto 0
+__all__ = ['StageRecord', 'instrumented', 'instrument', 'MemorySink', 'LogSink', 'PrometheusSink']
+
+# %% ../nbs/14_instrument.ipynb 4
+import functools
+import inspect
+import logging
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Union, List, Callable, NamedTuple
+
+# %% ../nbs/14_instrument.ipynb 6
+class StageRecord(NamedTuple):
+    "The measurements of one call of an instrumented function"
+    name: str # Name of the function
+    path: str # Names of the instrumented functions running, separated by `/`
+    seconds: float # Wall time of the call
+    own_seconds: float # Wall time not spent in nested instrumented functions
+    rows_in: int # Length of the input dataset, None if not known
+    rows_out: int # Length of the result, None if not known
+    bytes_in: int # Size of the input file, None if the input is not a file
+    allocated: int # Bytes still allocated at the end of the call, None if memory is not measured
+    peak: int # Peak of the allocated bytes during the call, None if memory is not measured
+
+class _Frame:
+    __slots__ = ('path', 'start', 'child_seconds', 'mem_start', 'mem_peak')
+
+    def __init__(self, path: str):
+        self.path, self.child_seconds = path, 0.
+
+_sinks = ()
+_memory = 0
+_local = threading.local()
+
+# %% ../nbs/14_instrument.ipynb 8
+def _size(x) -> int:
+    if isinstance(x, (list, tuple, set, dict)):
+        return len(x)
+    # pandas is not imported by this module, so that the modules it instruments can be imported without it
+    pd = sys.modules.get('pandas')
+    return len(x) if pd is not None and isinstance(x, (pd.DataFrame, pd.Series)) else None
+
+def _inputs(args: tuple) -> tuple:
+    "The number of rows and the number of bytes of the first dataset or file among the first two arguments (the first one can be `self`)"
+    for x in args[:2]:
+        if isinstance(x, (str, Path)):
+            try:
+                return None, os.path.getsize(x)
+            except OSError:
+                return None, None
+        n = _size(x)
+        if n is not None:
+            return n, None
+    return None, None
+
+def _enter(name: str) -> _Frame:
+    stack = _local.__dict__.setdefault('stack', [])
+    frame = _Frame(f"{stack[-1].path}/{name}" if stack else name)
+    if _memory:
+        current, peak = tracemalloc.get_traced_memory()
+        # the peak is reset for the nested stage, so the enclosing stages keep track of their own
+        for parent in stack:
+            parent.mem_peak = max(parent.mem_peak, peak)
+        tracemalloc.reset_peak()
+        frame.mem_start = frame.mem_peak = current
+    stack.append(frame)
+    frame.start = time.perf_counter()
+    return frame
+
+def _exit(frame: _Frame) -> tuple:
+    "Closes the frame, returning its wall time, own time, allocated bytes and peak bytes"
+    seconds = time.perf_counter() - frame.start
+    stack = _local.stack
+    stack.pop()
+    if stack:
+        stack[-1].child_seconds += seconds
+    allocated = peak = None
+    if _memory and hasattr(frame, 'mem_start'):
+        current, peak = tracemalloc.get_traced_memory()
+        peak = max(peak, frame.mem_peak)
+        for parent in stack:
+            parent.mem_peak = max(parent.mem_peak, peak)
+        allocated, peak = current - frame.mem_start, peak - frame.mem_start
+    return seconds, seconds - frame.child_seconds, allocated, peak
+
+def _emit(record: StageRecord):
+    for sink in _sinks:
+        sink(record)
+
+def _measure_call(f: Callable, name: str, args: tuple, kwargs: dict):
+    rows_in, bytes_in = _inputs(args)
+    frame = _enter(name)
+    try:
+        result = f(*args, **kwargs)
+    finally:
+        seconds, own, allocated, peak = _exit(frame)
+    _emit(StageRecord(name, frame.path, seconds, own, rows_in, _size(result), bytes_in, allocated, peak))
+    return result
+
+def _measure_generator(f: Callable, name: str, args: tuple, kwargs: dict):
+    "Runs a generator function, measuring only the time spent producing the items"
+    rows_in, bytes_in = _inputs(args)
+    totals, rows_out = [0., 0., None, None], 0
+    it = None
+    try:
+        while True:
+            frame = _enter(name)
+            try:
+                if it is None: it = f(*args, **kwargs)
+                item = next(it, frame)
+            finally:
+                measured = _exit(frame)
+                totals[0] += measured[0]
+                totals[1] += measured[1]
+                if measured[2] is not None:
+                    totals[2] = (totals[2] or 0) + measured[2]
+                    totals[3] = max(totals[3] or 0, measured[3])
+            if item is frame:
+                break
+            n = _size(item)
+            rows_out += 1 if n is None or isinstance(item, dict) else n
+            yield item
+    finally:
+        if it is not None: it.close()
+        _emit(StageRecord(name, frame.path, totals[0], totals[1], rows_in, rows_out, bytes_in, totals[2], totals[3]))
+
+def instrumented(f: Callable # The function (or method) to measure
+                ) -> Callable: # The function reporting its measurements to the active sinks
+    "Decorator measuring the calls of `f` made inside an `instrument` block"
+    name = f.__qualname__
+    measure = _measure_generator if inspect.isgeneratorfunction(f) else _measure_call
+    @functools.wraps(f)
+    def _instrumented(*args, **kwargs):
+        if not _sinks:
+            return f(*args, **kwargs)
+        return measure(f, name, args, kwargs)
+    return _instrumented
+
+# %% ../nbs/14_instrument.ipynb 11
+@contextmanager
+def instrument(*sinks: Callable, # The callables receiving the `StageRecord` of each call
+               memory: bool = False # Whether the allocated and peak memory should be measured with `tracemalloc`
+              ):
+    "Context manager sending the measurements of the instrumented functions to `sinks`"
+    global _sinks, _memory
+    previous = _sinks
+    start_tracing = memory and not tracemalloc.is_tracing()
+    if start_tracing: tracemalloc.start()
+    _sinks, _memory = previous + sinks, _memory + bool(memory)
+    try:
+        yield sinks[0] if len(sinks) == 1 else sinks
+    finally:
+        _sinks, _memory = previous, _memory - bool(memory)
+        if start_tracing: tracemalloc.stop()
+
+# %% ../nbs/14_instrument.ipynb 13
+class MemorySink:
+    "Collects the records of the instrumented calls in a list"
+    def __init__(self):
+        self.records = []
+
+    def __call__(self, record: StageRecord):
+        self.records.append(record)
+
+    def frame(self) -> 'pd.DataFrame':
+        "A dataframe with one row per record"
+        import pandas as pd
+        return pd.DataFrame(self.records, columns=list(StageRecord._fields))
+
+    def summary(self) -> 'pd.DataFrame':
+        "Calls, total times, rows and largest peak of each stage, the slowest stages first"
+        summary = self.frame().groupby('path', sort=False).agg(
+            calls=('name', 'size'), seconds=('seconds', 'sum'), own_seconds=('own_seconds', 'sum'),
+            rows_in=('rows_in', 'sum'), rows_out=('rows_out', 'sum'), peak=('peak', 'max'))
+        return summary.sort_values('own_seconds', ascending=False)
+
+    def clear(self):
+        self.records.clear()
+
+# %% ../nbs/14_instrument.ipynb 14
+class LogSink:
+    "Logs one line with the measurements of every instrumented call"
+    def __init__(self,
+                 logger: Union[logging.Logger, str] = 'xapi_analysis', # The logger, or its name
+                 level: int = logging.INFO # The level of the messages
+                ):
+        self.logger = logging.getLogger(logger) if isinstance(logger, str) else logger
+        self.level = level
+
+    def __call__(self, record: StageRecord):
+        if self.logger.isEnabledFor(self.level):
+            self.logger.log(self.level, ' '.join(f"{k}={v:.6f}" if isinstance(v, float) else f"{k}={v}"
+                                                 for k, v in zip(StageRecord._fields[1:], record[1:]) if v is not None))
+
+# %% ../nbs/14_instrument.ipynb 15
+_prometheus_metrics = [('calls_total', 'counter', 'Number of calls'),
+                       ('seconds_total', 'counter', 'Wall time of the calls'),
+                       ('own_seconds_total', 'counter', 'Wall time of the calls, excluding the nested stages'),
+                       ('rows_in_total', 'counter', 'Rows received'),
+                       ('rows_out_total', 'counter', 'Rows returned or generated'),
+                       ('bytes_in_total', 'counter', 'Bytes of the files read'),
+                       ('allocated_bytes_total', 'counter', 'Bytes still allocated at the end of the calls'),
+                       ('peak_bytes', 'gauge', 'Largest peak of allocated bytes during a call')]
+
+class PrometheusSink:
+    "Accumulates the measurements of each stage, and renders them in the Prometheus text format"
+    def __init__(self, prefix: str = 'xapi_analysis_stage' # Prefix of the names of the metrics
+                ):
+        self.prefix, self.stages = prefix, {}
+        self._lock = threading.Lock()
+
+    def __call__(self, record: StageRecord):
+        values = (1, record.seconds, record.own_seconds, record.rows_in, record.rows_out, record.bytes_in, record.allocated)
+        with self._lock:
+            totals = self.stages.setdefault(record.path, [0] * len(_prometheus_metrics))
+            for i, v in enumerate(values):
+                if v is not None: totals[i] += v
+            if record.peak is not None:
+                totals[-1] = max(totals[-1], record.peak)
+
+    def text(self) -> str:
+        "The metrics in the Prometheus text exposition format"
+        lines = []
+        with self._lock:
+            for i, (metric, kind, description) in enumerate(_prometheus_metrics):
+                name = f"{self.prefix}_{metric}"
+                lines += [f"# HELP {name} {description}", f"# TYPE {name} {kind}"]
+                for path, totals in self.stages.items():
+                    label = path.replace('\\', '\\\\').replace('"', '\\"')
+                    lines.append(f'{name}{{stage="{label}"}} {totals[i]}')
+        return '\n'.join(lines) + '\n'
+
+    def write(self, path: Union[str, Path] # The file, e.g. a `.prom` file in the directory of the textfile collector
+             ):
+        "Writes the metrics to a file, replacing it atomically"
+        tmp = Path(f"{path}.tmp")
+        tmp.write_text(self.text())
+        os.replace(tmp, path)
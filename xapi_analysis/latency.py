@@ -0,0 +1,95 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/07_latency.ipynb.
+
+# %% auto 0
+__all__ = ['default_lag_bins', 'ingestion_lag', 'lag_percentiles', 'LagHistogram']
+
+# %% ../nbs/07_latency.ipynb 4
+import numpy as np
+import pandas as pd
+from typing import Union, List, Sequence, Iterable
+from .input_csv import _iter_chunks
+
+# %% ../nbs/07_latency.ipynb 8
+def ingestion_lag(df: pd.DataFrame # The dataset containing the xAPI statements, with *timestamp* and *stored* columns
+                 ) -> pd.Series: # The time between the generation and the storage of each statement
+    """
+    Computes the time elapsed between when each statement was generated and when it was stored in the database
+    """
+    return (df['stored'] - df['timestamp']).rename('lag')
+
+# %% ../nbs/07_latency.ipynb 11
+def _percentile_names(percentiles: Sequence[float]) -> List[str]:
+    return [f"p{q * 100:g}" for q in percentiles]
+
+def lag_percentiles(df: pd.DataFrame, # The dataset containing the xAPI statements, with *timestamp* and *stored* columns
+                    by: Union[str, List, None] = None, # Column or columns used to group the statements
+                    freq: str = None, # Length of the time windows used to group the statements, e.g. '1h'
+                    percentiles: Sequence[float] = (0.5, 0.95, 0.99) # The percentiles to compute
+                   ) -> pd.DataFrame: # The number of statements and the percentiles of the delay, in seconds, per group
+    """
+    Computes the percentiles of the delay between generation and storage of the statements, for each group
+    """
+    lag = ingestion_lag(df).dt.total_seconds()
+    keys = [] if by is None else [df[c] for c in ([by] if isinstance(by, str) else by)]
+    if freq is not None:
+        keys.append(df['timestamp'].dt.floor(freq))
+    if not keys:
+        res = lag.quantile(list(percentiles)).to_frame().T.reset_index(drop=True)
+        res.columns = _percentile_names(percentiles)
+        res.insert(0, 'count', lag.count())
+        return res
+    grouped = lag.groupby(keys, observed=True)
+    res = grouped.quantile(list(percentiles)).unstack()
+    res.columns = _percentile_names(percentiles)
+    res.insert(0, 'count', grouped.count())
+    return res.reset_index()
+
+# %% ../nbs/07_latency.ipynb 14
+default_lag_bins = np.concatenate([[0], np.logspace(-3, np.log10(86400), 60)])
+
+class LagHistogram:
+    "Histograms of the ingestion delay over rolling time windows"
+    def __init__(self,
+                 bins: Sequence[float] = default_lag_bins, # Increasing edges of the bins, in seconds
+                 freq: str = '1h', # Length of the time windows
+                 max_windows: int = 24 # Number of windows to keep
+                ):
+        self.bins, self.freq, self.max_windows = np.asarray(bins, dtype=float), freq, max_windows
+        self.windows = {} # start of the window -> counts per bin, with an underflow and an overflow bin
+
+    def update(self, df: Union[pd.DataFrame, Iterable[pd.DataFrame]] # A new batch of statements, or an iterable of chunks
+              ) -> 'LagHistogram':
+        "Adds the delays of the statements to the histograms of their windows"
+        for chunk in _iter_chunks(df):
+            lag = ingestion_lag(chunk).dt.total_seconds().to_numpy()
+            window = pd.DatetimeIndex(chunk['timestamp']).floor(self.freq).asi8
+            valid = ~np.isnan(lag)
+            win_codes, win_values = pd.factorize(window[valid])
+            bin_codes = np.searchsorted(self.bins, lag[valid], side='right')
+            n_bins = len(self.bins) + 1
+            counts = np.bincount(win_codes * n_bins + bin_codes, minlength=len(win_values) * n_bins)
+            for i, w in enumerate(pd.to_datetime(win_values, utc=True)):
+                c = counts[i * n_bins:(i + 1) * n_bins]
+                self.windows[w] = self.windows[w] + c if w in self.windows else c
+        for w in sorted(self.windows)[:max(len(self.windows) - self.max_windows, 0)]:
+            del self.windows[w]
+        return self
+
+    def histogram(self) -> pd.DataFrame:
+        "The counts of each bin (columns, labelled by their upper edge) for each window (rows)"
+        cols = list(self.bins) + [np.inf]
+        return pd.DataFrame([self.windows[w] for w in sorted(self.windows)], index=sorted(self.windows), columns=cols)
+
+    def percentiles(self, percentiles: Sequence[float] = (0.5, 0.95, 0.99), # The percentiles to estimate
+                    per_window: bool = False # Whether to compute the percentiles per window or over all the windows
+                   ) -> pd.DataFrame: # The estimated percentiles of the delay, in seconds
+        "Estimates the percentiles of the delay from the histograms"
+        hist = self.histogram()
+        if not per_window:
+            hist = hist.sum().to_frame().T
+        cum = hist.to_numpy().cumsum(axis=1)
+        edges = hist.columns.to_numpy(dtype=float)
+        res = pd.DataFrame({name: edges[np.argmax(cum >= q * cum[:, -1:], axis=1)]
+                            for name, q in zip(_percentile_names(percentiles), percentiles)}, index=hist.index)
+        res.insert(0, 'count', cum[:, -1])
+        return res if per_window else res.reset_index(drop=True)
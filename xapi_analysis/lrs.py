@@ -0,0 +1,247 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/11_lrs.ipynb.
+
+# %% auto 0
+__all__ = ['LRSClient', 'fetch_statements']
+
+# %% ../nbs/11_lrs.ipynb 4
+import asyncio
+import base64
+import ssl
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Union, List, Dict, NamedTuple, AsyncIterator
+from urllib.parse import urlsplit, urljoin, urlencode
+from . import input_json
+from .input_json import statements_to_dataframe, json_backends
+
+# %% ../nbs/11_lrs.ipynb 8
+class _Response(NamedTuple):
+    status: int
+    headers: Dict[str, str]
+    body: bytes
+
+async def _read_response(reader: asyncio.StreamReader) -> _Response:
+    "Reads an HTTP/1.1 response, whose body has a known length or is chunked"
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError("The connection was closed by the server")
+    headers = {}
+    while (line := await reader.readline()) not in (b'\r\n', b'\n', b''):
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+    if headers.get('transfer-encoding', '').lower() == 'chunked':
+        body = bytearray()
+        while (size := int((await reader.readline()).split(b';')[0], 16)) > 0:
+            body += await reader.readexactly(size)
+            await reader.readexactly(2)
+        while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+            pass
+        body = bytes(body)
+    elif 'content-length' in headers:
+        body = await reader.readexactly(int(headers['content-length']))
+    else:
+        body, headers['connection'] = await reader.read(), 'close'
+    return _Response(int(status_line.split()[1]), headers, body)
+
+class _ConnectionPool:
+    "Keep-alive connections to a single server, with at most `size` requests at the same time"
+    def __init__(self, host: str, port: int, use_ssl: bool, size: int):
+        self.host, self.port, self.size = host, port, size
+        self.ssl = ssl.create_default_context() if use_ssl else None
+        self.slots, self.idle, self.opened = asyncio.Semaphore(size), [], 0
+
+    async def request(self, raw: bytes) -> _Response:
+        async with self.slots:
+            conn = self.idle.pop() if self.idle else None
+            for attempt in range(2):
+                if conn is None:
+                    conn = await asyncio.open_connection(self.host, self.port, ssl=self.ssl)
+                    self.opened += 1
+                reader, writer = conn
+                try:
+                    writer.write(raw)
+                    await writer.drain()
+                    response = await _read_response(reader)
+                    break
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    writer.close()
+                    conn = None
+                    # an idle connection may have been closed by the server: the request is sent again on a new one
+                    if attempt == 1: raise
+                except BaseException:
+                    # e.g. cancelled by a timeout: the rest of the response may still arrive, so the connection cannot be reused
+                    writer.close()
+                    raise
+            if response.headers.get('connection', '').lower() == 'close':
+                writer.close()
+            else:
+                self.idle.append(conn)
+            return response
+
+    def close(self):
+        for _, writer in self.idle:
+            writer.close()
+        self.idle = []
+
+# %% ../nbs/11_lrs.ipynb 10
+_retry_statuses = {429, 500, 502, 503, 504}
+
+def _retry_after(value: str, # The Retry-After header, a number of seconds or an HTTP date
+                 default: float # The seconds to wait if the header is missing or invalid
+                ) -> float: # The seconds to wait before retrying
+    if value is None:
+        return default
+    try:
+        return max(float(value), 0.)
+    except ValueError:
+        pass
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return default
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return max((date - datetime.now(timezone.utc)).total_seconds(), 0.)
+
+def _split_window(since: str, until: str, windows: int) -> List[list]:
+    "Splits the period between `since` and `until` into `windows` periods of the same length"
+    if windows == 1:
+        return [[since, until, None]]
+    if since is None or until is None:
+        raise ValueError("Both since and until are needed to split the period into windows")
+    bounds = pd.date_range(pd.Timestamp(since), pd.Timestamp(until), periods=windows + 1)
+    return [[a.isoformat(), b.isoformat(), None] for a, b in zip(bounds[:-1], bounds[1:])]
+
+class LRSClient:
+    "Asynchronous client of the xAPI statements endpoint of a Learning Record Store"
+    def __init__(self,
+                 endpoint: str, # The xAPI endpoint of the LRS, e.g. `https://lrs.example.com/data/xAPI/`
+                 username: str = None, # The key of the LRS client, for basic authentication
+                 password: str = None, # The secret of the LRS client
+                 max_connections: int = 4, # The maximum number of connections, and of requests at the same time
+                 max_retries: int = 5, # The number of times a failed request is retried
+                 backoff: float = 0.5, # The seconds waited before retrying a request the first time
+                 timeout: float = 60, # The seconds after which a request fails
+                 backend: str = None, # The json parser from `input_json.json_backends`, `input_json.json_backend` if not given
+                 version: str = '1.0.3' # The xAPI version sent to the LRS
+                ):
+        self.endpoint = endpoint if endpoint.endswith('/') else endpoint + '/'
+        url = urlsplit(self.endpoint)
+        self.pool = _ConnectionPool(url.hostname, url.port or (443 if url.scheme == 'https' else 80),
+                                    url.scheme == 'https', max_connections)
+        self.headers = f"Host: {url.netloc}\r\nX-Experience-API-Version: {version}\r\nAccept: application/json\r\n"
+        if username is not None:
+            token = base64.b64encode(f"{username}:{password or ''}".encode()).decode()
+            self.headers += f"Authorization: Basic {token}\r\n"
+        self.max_retries, self.backoff, self.timeout = max_retries, backoff, timeout
+        self.loads = json_backends[backend or input_json.json_backend]
+        self.pending = []
+
+    async def get(self, url: str # The url to request, relative to the endpoint
+                 ) -> dict: # The json content of the response
+        "Requests a resource of the LRS, retrying if the request fails"
+        target = urlsplit(urljoin(self.endpoint, url))
+        raw = f"GET {target.path}{'?' + target.query if target.query else ''} HTTP/1.1\r\n{self.headers}\r\n".encode()
+        for attempt in range(self.max_retries + 1):
+            delay = self.backoff * 2 ** attempt
+            try:
+                response = await asyncio.wait_for(self.pool.request(raw), self.timeout)
+            except (OSError, asyncio.IncompleteReadError, asyncio.TimeoutError) as e:
+                error = e
+            else:
+                if response.status == 200:
+                    return self.loads(response.body)
+                error = ConnectionError(f"The LRS answered {response.status} to {url}")
+                if response.status not in _retry_statuses:
+                    raise error
+                delay = _retry_after(response.headers.get('retry-after'), delay)
+            if attempt < self.max_retries:
+                await asyncio.sleep(delay)
+        raise error
+
+    async def pages(self,
+                    since: str = None, # Only the statements stored after this date (ISO 8601)
+                    until: str = None, # Only the statements stored before or at this date (ISO 8601)
+                    windows: Union[int, List[list]] = 1, # The number of periods downloaded concurrently, or the periods to download
+                    **params # Other parameters of the statements resource, e.g. `verb` or `limit`
+                   ) -> AsyncIterator[List[dict]]: # The statements of each page, in the order they are received
+        "Downloads the statements stored between `since` and `until`, one page at a time"
+        if isinstance(windows, int):
+            self.pending = _split_window(since, until, windows)
+        else:
+            self.pending = [list(w) + [None] * (3 - len(w)) for w in windows]
+        queue = asyncio.Queue(maxsize=2 * len(self.pending))
+
+        async def follow(window):
+            try:
+                url = window[2]
+                if not url:
+                    query = {**params, 'ascending': 'true'}
+                    query.update({k: v for k, v in zip(['since', 'until'], window) if v is not None})
+                    url = 'statements?' + urlencode(query)
+                while url:
+                    page = await self.get(url)
+                    url = page.get('more')
+                    await queue.put((window, page.get('statements', []), url))
+            except Exception as e:
+                await queue.put((window, e, None))
+
+        tasks = [asyncio.create_task(follow(window)) for window in self.pending]
+        try:
+            remaining = len(tasks)
+            while remaining:
+                window, statements, more = await queue.get()
+                if isinstance(statements, Exception):
+                    raise statements
+                yield statements
+                # the cursor moves forward only once the page has been processed
+                if more:
+                    window[2] = more
+                else:
+                    self.pending.remove(window)
+                    remaining -= 1
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def frames(self, since: str = None, until: str = None, windows: Union[int, List[list]] = 1, **params
+                    ) -> AsyncIterator[pd.DataFrame]: # A dataframe for each page, like `input_json.statements_to_dataframe`
+        "Like `pages`, but converts each page to a DataFrame with the schema of `input_json.load_statements`"
+        async for statements in self.pages(since, until, windows, **params):
+            yield statements_to_dataframe(statements)
+
+    def close(self):
+        "Closes the idle connections"
+        self.pool.close()
+
+# %% ../nbs/11_lrs.ipynb 22
+def _run(coro):
+    "Runs a coroutine to completion, also when called from a running event loop (e.g. in a notebook)"
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+def fetch_statements(endpoint: str, # The xAPI endpoint of the LRS
+                     since: str = None, # Only the statements stored after this date (ISO 8601)
+                     until: str = None, # Only the statements stored before or at this date (ISO 8601)
+                     windows: int = 1, # The number of periods downloaded concurrently
+                     params: dict = None, # Other parameters of the statements resource, e.g. `verb`
+                     **client_params # The parameters of `LRSClient`, e.g. `username` and `password`
+                    ) -> pd.DataFrame: # A dataframe with one statement per row
+    """
+    Downloads the statements of a Learning Record Store into a DataFrame with the schema of `input_json.load_statements`
+    """
+    async def download():
+        client = LRSClient(endpoint, **client_params)
+        try:
+            frames = [df async for df in client.frames(since, until, windows, **(params or {}))]
+        finally:
+            client.close()
+        return pd.concat(frames, ignore_index=True) if frames else statements_to_dataframe([])
+    return _run(download())
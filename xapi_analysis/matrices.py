@@ -0,0 +1,221 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/15_matrices.ipynb.
+
+# %% auto 0
+__all__ = ['SparseMatrix', 'EngagementMatrix', 'engagement_matrix', 'TransitionMatrix', 'transition_matrix']
+
+# %% ../nbs/15_matrices.ipynb 4
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import Union, Iterable, NamedTuple
+from .input_csv import _iter_chunks
+
+# %% ../nbs/15_matrices.ipynb 6
+try:
+    import scipy.sparse as sp
+except ImportError:
+    sp = None
+
+# %% ../nbs/15_matrices.ipynb 10
+class SparseMatrix(NamedTuple):
+    "A sparse matrix in coordinate format, with the labels of its rows and columns"
+    row: np.ndarray # The row of each entry
+    col: np.ndarray # The column of each entry
+    data: np.ndarray # The value of each entry
+    row_labels: pd.Index # The value corresponding to each row, named after its column
+    col_labels: pd.Index # The value corresponding to each column, named after its column
+    name: str = 'count' # What the values are
+
+    @property
+    def shape(self) -> tuple:
+        return len(self.row_labels), len(self.col_labels)
+
+    @property
+    def nnz(self) -> int:
+        "The number of stored entries"
+        return len(self.data)
+
+    def tocoo(self):
+        "The matrix as a `scipy.sparse.coo_matrix`"
+        if sp is None:
+            raise ImportError("scipy is needed to build a scipy.sparse matrix, use `to_frame` or `to_dense` without it")
+        return sp.coo_matrix((self.data, (self.row, self.col)), shape=self.shape)
+
+    def tocsr(self):
+        "The matrix as a `scipy.sparse.csr_matrix`"
+        return self.tocoo().tocsr()
+
+    def to_frame(self) -> pd.DataFrame:
+        "A dataframe with the labels of the row and of the column and the value of each entry"
+        return pd.DataFrame({self.row_labels.name: self.row_labels[self.row], self.col_labels.name: self.col_labels[self.col],
+                             self.name: self.data})
+
+    def to_dense(self) -> pd.DataFrame:
+        "The full matrix as a dataframe, only for small matrices"
+        values = np.zeros(self.shape, dtype=self.data.dtype)
+        values[self.row, self.col] = self.data
+        return pd.DataFrame(values, index=self.row_labels, columns=self.col_labels)
+
+# %% ../nbs/15_matrices.ipynb 12
+class _Labels:
+    "Consecutive integer codes of the values of a column, stable across chunks"
+    def __init__(self, name: str):
+        self.index = pd.Index([], dtype=object, name=name)
+
+    def encode(self, s: pd.Series # The values to encode
+              ) -> np.ndarray: # The code of each value, -1 for missing values
+        codes, uniques = pd.factorize(s)
+        uniques = np.asarray(uniques, dtype=object)
+        known = self.index.get_indexer(uniques)
+        new = known < 0
+        if new.any():
+            known[new] = len(self.index) + np.arange(new.sum())
+            self.index = self.index.append(pd.Index(uniques[new], dtype=object, name=self.index.name))
+        # missing values are coded as -1 and map to the trailing -1
+        return np.append(known, -1)[codes]
+
+def _sum_duplicates(keys: np.ndarray, data: np.ndarray) -> tuple:
+    "Sorts the keys and adds up the values of equal keys"
+    if len(keys) == 0:
+        return keys, data
+    order = np.argsort(keys, kind='stable')
+    keys, data = keys[order], data[order]
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    return keys[starts], np.add.reduceat(data, starts)
+
+class _CooSums:
+    "Sums of the values added at each (row, column) position"
+    def __init__(self, dtype):
+        self.keys, self.data = np.empty(0, dtype=np.int64), np.empty(0, dtype=dtype)
+        self._pending, self._n_pending = [], 0
+
+    def add(self, row: np.ndarray, col: np.ndarray, data: np.ndarray):
+        keys, data = _sum_duplicates((row.astype(np.int64) << 32) | col.astype(np.int64), data.astype(self.data.dtype))
+        self._pending.append((keys, data))
+        self._n_pending += len(keys)
+        if self._n_pending >= len(self.keys):
+            self._merge()
+
+    def _merge(self):
+        if not self._pending: return
+        self.keys, self.data = _sum_duplicates(np.concatenate([self.keys] + [k for k, _ in self._pending]),
+                                               np.concatenate([self.data] + [d for _, d in self._pending]))
+        self._pending, self._n_pending = [], 0
+
+    def matrix(self, row_labels: pd.Index, col_labels: pd.Index, name: str) -> SparseMatrix:
+        self._merge()
+        return SparseMatrix(self.keys >> 32, self.keys & 0xFFFFFFFF, self.data, row_labels, col_labels, name)
+
+# %% ../nbs/15_matrices.ipynb 15
+class _IncrementalMatrix:
+    def save(self, path: Union[str, Path]):
+        "Stores the state of the matrix on disk"
+        pd.to_pickle(vars(self), path)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]):
+        "Loads a matrix stored with `save`"
+        m = cls.__new__(cls)
+        vars(m).update(pd.read_pickle(path))
+        return m
+
+class EngagementMatrix(_IncrementalMatrix):
+    "Number of statements, or sum of a column, for each pair of values of two columns, updated one chunk at a time"
+    def __init__(self,
+                 rows: str = 'actor', # The column whose values are the rows of the matrix
+                 cols: str = 'object', # The column whose values are the columns of the matrix
+                 values: str = None, # The column to sum, the statements are counted if not given
+                 df: Union[pd.DataFrame, Iterable[pd.DataFrame]] = None # The statements used to initialize the matrix
+                ):
+        self.rows, self.cols, self.values = rows, cols, values
+        self._rows, self._cols = _Labels(rows), _Labels(cols)
+        self._sums = _CooSums(np.int64 if values is None else np.float64)
+        if df is not None:
+            self.update(df)
+
+    def update(self, df: Union[pd.DataFrame, Iterable[pd.DataFrame]] # A new batch of statements, or an iterable of chunks
+              ) -> 'EngagementMatrix':
+        "Adds the statements of a new batch"
+        for chunk in _iter_chunks(df):
+            row, col = self._rows.encode(chunk[self.rows]), self._cols.encode(chunk[self.cols])
+            keep = (row >= 0) & (col >= 0)
+            if self.values is None:
+                data = np.ones(len(chunk), dtype=np.int64)
+            else:
+                data = chunk[self.values].to_numpy(dtype=np.float64, na_value=np.nan)
+                keep &= ~np.isnan(data)
+            self._sums.add(row[keep], col[keep], data[keep])
+        return self
+
+    def snapshot(self) -> SparseMatrix:
+        "The matrix of all the statements seen so far"
+        return self._sums.matrix(self._rows.index, self._cols.index, self.values or 'count')
+
+def engagement_matrix(df: Union[pd.DataFrame, Iterable[pd.DataFrame]], # The dataset containing the xAPI statements, or an iterable of chunks
+                      rows: str = 'actor', # The column whose values are the rows of the matrix
+                      cols: str = 'object', # The column whose values are the columns of the matrix
+                      values: str = None # The column to sum, the statements are counted if not given
+                     ) -> SparseMatrix: # The sparse matrix, with a row for each actor and a column for each object
+    """
+    Counts the statements of each actor on each object (or of any other pair of columns), or sums the `values` column
+    """
+    return EngagementMatrix(rows, cols, values, df).snapshot()
+
+# %% ../nbs/15_matrices.ipynb 22
+class TransitionMatrix(_IncrementalMatrix):
+    "Number of transitions between the values of a column in the statements of each actor, updated one chunk at a time"
+    def __init__(self,
+                 col: str = 'object', # The column whose transitions are counted, e.g. **object** or **verb**
+                 by: str = 'actor', # The column identifying the sequences, e.g. **actor** or **session**
+                 time: str = 'timestamp', # The column ordering the statements, the order of the rows is kept if None
+                 self_loops: bool = True, # Whether a transition from a value to itself is counted
+                 df: Union[pd.DataFrame, Iterable[pd.DataFrame]] = None # The statements used to initialize the matrix
+                ):
+        self.col, self.by, self.time, self.self_loops = col, by, time, self_loops
+        self._values, self._by = _Labels(col), _Labels(by)
+        self._last = np.empty(0, dtype=np.int64) # the code of the last value of each sequence, -1 if none
+        self._sums = _CooSums(np.int64)
+        if df is not None:
+            self.update(df)
+
+    def update(self, df: Union[pd.DataFrame, Iterable[pd.DataFrame]] # A new batch of statements, or an iterable of chunks, in chronological order
+              ) -> 'TransitionMatrix':
+        "Adds the transitions of a new batch of statements"
+        for chunk in _iter_chunks(df):
+            seq, value = self._by.encode(chunk[self.by]), self._values.encode(chunk[self.col])
+            valid = (seq >= 0) & (value >= 0)
+            seq, value = seq[valid], value[valid]
+            if self.time is None:
+                order = np.argsort(seq, kind='stable')
+            else:
+                order = np.lexsort((pd.DatetimeIndex(chunk[self.time]).asi8[valid], seq))
+            seq, value = seq[order], value[order]
+            if len(self._last) < len(self._by.index):
+                self._last = np.r_[self._last, np.full(len(self._by.index) - len(self._last), -1, dtype=np.int64)]
+            first = np.ones(len(seq), dtype=bool) # first statement of each sequence in the chunk
+            first[1:] = seq[1:] != seq[:-1]
+            prev = np.empty(len(seq), dtype=np.int64)
+            prev[1:] = value[:-1]
+            prev[first] = self._last[seq[first]]
+            keep = prev >= 0
+            if not self.self_loops:
+                keep &= prev != value
+            self._sums.add(prev[keep], value[keep], np.ones(keep.sum(), dtype=np.int64))
+            last = np.r_[first[1:], True]
+            self._last[seq[last]] = value[last]
+        return self
+
+    def snapshot(self) -> SparseMatrix:
+        "The transitions of all the statements seen so far, from the value of each row to the value of each column"
+        return self._sums.matrix(self._values.index.rename('from'), self._values.index.rename('to'), 'count')
+
+def transition_matrix(df: Union[pd.DataFrame, Iterable[pd.DataFrame]], # The dataset containing the xAPI statements, or an iterable of chunks in chronological order
+                      col: str = 'object', # The column whose transitions are counted, e.g. **object** or **verb**
+                      by: str = 'actor', # The column identifying the sequences, e.g. **actor** or **session**
+                      time: str = 'timestamp', # The column ordering the statements, the order of the rows is kept if None
+                      self_loops: bool = True # Whether a transition from a value to itself is counted
+                     ) -> SparseMatrix: # The square sparse matrix, from the value of each row to the value of each column
+    """
+    Counts the transitions between the objects (or the values of another column) of consecutive statements of each actor
+    """
+    return TransitionMatrix(col, by, time, self_loops, df).snapshot()
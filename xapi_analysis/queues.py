@@ -0,0 +1,63 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/08_queues.ipynb.
+
+# %% auto 0
+__all__ = ['queue_fields', 'stuck_fields', 'QueueHealth', 'scan_queues']
+
+# %% ../nbs/08_queues.ipynb 4
+import pandas as pd
+from collections import Counter
+from pathlib import Path
+from typing import Union, List, NamedTuple
+from .input_json import iter_statements
+
+# %% ../nbs/08_queues.ipynb 8
+queue_fields = ['completedQueues', 'processingQueues', 'completedForwardingQueue', 'pendingForwardingQueue',
+                'failedForwardingLog', 'deadForwardingQueue']
+stuck_fields = ['deadForwardingQueue', 'pendingForwardingQueue']
+_scan_keys = queue_fields + ['_id', 'hash', 'client', 'stored', 'statementForwarding_id']
+
+# %% ../nbs/08_queues.ipynb 9
+class QueueHealth(NamedTuple):
+    "The aggregated state of the queues in a dump of statements"
+    counts: pd.DataFrame
+    by_time: pd.DataFrame
+    stuck: pd.DataFrame
+
+# %% ../nbs/08_queues.ipynb 10
+def _queue_name(entry) -> str:
+    "The queue name, or the forwarder id of a failed forwarding log entry"
+    return entry.get('statementForwarding_id', '') if isinstance(entry, dict) else str(entry)
+
+def _count_windows(by_time: pd.Series, stored: List[str], states: List[str], freq: str) -> pd.Series:
+    "Adds a batch of statements to the counts per time window and state"
+    windows = pd.to_datetime(pd.Series(stored, dtype=object), utc=True, format='ISO8601', errors='coerce').dt.floor(freq)
+    partial = pd.Series(1, index=pd.MultiIndex.from_arrays([windows, states], names=['stored', 'state'])).groupby(level=[0, 1]).sum()
+    return partial if by_time is None else by_time.add(partial, fill_value=0)
+
+# %% ../nbs/08_queues.ipynb 11
+def scan_queues(json_file: Union[str, Path], # Filename of the json array or newline-delimited json with the statements
+                freq: str = '1h', # Size of the time windows of the stored date
+                batch_size: int = 100_000 # Number of statements bucketed at once
+               ) -> QueueHealth: # Counts per state and queue, per state and time window, and the stuck statements
+    """
+    Aggregates the queue metadata of a dump of statements, reading only the queue fields of each statement
+    """
+    counts, by_time, stuck = Counter(), None, []
+    stored, states = [], []
+    for st in iter_statements(json_file, keys=_scan_keys):
+        for state in queue_fields:
+            entries = st.get(state)
+            if not entries: continue
+            for entry in entries: counts[state, _queue_name(entry)] += 1
+            stored.append(st.get('stored')); states.append(state)
+            if state in stuck_fields: stuck.append((st.get('_id'), st.get('hash'), st.get('client'), st.get('stored'), state))
+        if len(stored) >= batch_size:
+            by_time = _count_windows(by_time, stored, states, freq)
+            stored, states = [], []
+    if stored: by_time = _count_windows(by_time, stored, states, freq)
+    counts = pd.DataFrame([(s, q, n) for (s, q), n in counts.items()], columns=['state', 'queue', 'count'])
+    by_time = by_time.astype('int64').rename('statements').reset_index() if by_time is not None else \
+        pd.DataFrame(columns=['stored', 'state', 'statements'])
+    stuck = pd.DataFrame(stuck, columns=['_id', 'hash', 'client', 'stored', 'state'])
+    stuck['stored'] = pd.to_datetime(stuck['stored'], utc=True, format='ISO8601', errors='coerce')
+    return QueueHealth(counts.sort_values(['state', 'queue'], ignore_index=True), by_time, stuck)
@@ -0,0 +1,122 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/06_sessions.ipynb.
+
+# %% auto 0
+__all__ = ['Sessionizer', 'sessionize', 'session_summary', 'time_on_task']
+
+# %% ../nbs/06_sessions.ipynb 4
+import numpy as np
+import pandas as pd
+from typing import Union, Iterable, Sequence
+from .input_csv import _iter_chunks
+
+# %% ../nbs/06_sessions.ipynb 7
+_state_columns = ['last_time', 'ended', 'session', 'last_object']
+
+class Sessionizer:
+    "Splits the statements of each actor into sessions, one chunk at a time"
+    def __init__(self,
+                 gap: Union[str, pd.Timedelta] = '30min', # Inactivity time after which a new session starts
+                 start_verbs: Sequence = ('Logged In',), # Verbs which always start a new session
+                 end_verbs: Sequence = ('Logged Out',) # Verbs which end the current session
+                ):
+        self.gap, self.start_verbs, self.end_verbs = pd.Timedelta(gap), list(start_verbs), list(end_verbs)
+        self.n_sessions = 0
+        self._state = pd.DataFrame(columns=_state_columns)
+
+    def process(self, df: pd.DataFrame # A chunk of statements, with actor, verb, object and timestamp columns
+               ) -> pd.DataFrame: # The chunk sorted by actor and timestamp, with the session columns
+        "Assigns each statement of the chunk to a session"
+        actor_codes, actors = pd.factorize(df['actor'], use_na_sentinel=False)
+        t = pd.DatetimeIndex(df['timestamp']).asi8
+        order = np.lexsort((t, actor_codes))
+        a, t = actor_codes[order], t[order]
+        verbs, objects = df['verb'].to_numpy()[order], df['object'].to_numpy(dtype=object)[order]
+        n = len(df)
+        first = np.ones(n, dtype=bool) # first statement of each actor in the chunk
+        first[1:] = a[1:] != a[:-1]
+        is_end = np.isin(verbs, self.end_verbs)
+        new = first | np.isin(verbs, self.start_verbs)
+        new[1:] |= (np.diff(t) > self.gap.value) | is_end[:-1]
+        since = np.empty(n, dtype=np.int64)
+        since[1:] = np.diff(t)
+        prev_object = np.empty(n, dtype=object)
+        prev_object[1:] = objects[:-1]
+
+        # the first statement of an actor may continue the last session of a previous chunk
+        first_pos = np.flatnonzero(first)
+        state = self._state.reindex(actors[a[first_pos]])
+        known = state['last_time'].notna().to_numpy()
+        last_time = state['last_time'].fillna(0).to_numpy(dtype=np.int64)
+        cont = known & ~state['ended'].fillna(True).to_numpy(dtype=bool)
+        cont &= ~np.isin(verbs[first_pos], self.start_verbs) & (t[first_pos] - last_time <= self.gap.value)
+        since[first_pos] = t[first_pos] - last_time
+        prev_object[first_pos] = state['last_object'].to_numpy()
+        new[first_pos] = ~cont
+
+        # segments are delimited by new sessions and by changes of actor, continued segments reuse the old id
+        seg = np.cumsum(new | first) - 1
+        seg_ids = np.full(seg[-1] + 1 if n else 0, -1, dtype=np.int64)
+        seg_ids[seg[first_pos[cont]]] = state['session'].to_numpy()[cont]
+        fresh = seg_ids < 0
+        seg_ids[fresh] = self.n_sessions + np.arange(fresh.sum())
+        self.n_sessions += int(fresh.sum())
+        session = seg_ids[seg]
+
+        last_pos = np.r_[first_pos[1:] - 1, n - 1] if n else first_pos
+        new_state = pd.DataFrame({'last_time': t[last_pos], 'ended': is_end[last_pos], 'session': session[last_pos],
+                                  'last_object': objects[last_pos]}, index=actors[a[last_pos]])
+        self._state = pd.concat([self._state.drop(new_state.index, errors='ignore'), new_state])
+
+        out = df.iloc[order].copy()
+        out['session'] = session
+        out['since_previous'] = pd.to_timedelta(np.where(new, np.iinfo(np.int64).min, since))
+        out['previous_object'] = np.where(new, None, prev_object)
+        return out
+
+    def process_chunks(self, chunks: Iterable[pd.DataFrame] # Chunks of statements, in chronological order
+                      ) -> Iterable[pd.DataFrame]: # The processed chunks
+        "Assigns the statements of a stream of chunks to sessions"
+        for chunk in chunks:
+            yield self.process(chunk)
+
+# %% ../nbs/06_sessions.ipynb 8
+def sessionize(df: pd.DataFrame, # The dataset containing the xAPI statements (one statement per row)
+               gap: Union[str, pd.Timedelta] = '30min', # Inactivity time after which a new session starts
+               start_verbs: Sequence = ('Logged In',), # Verbs which always start a new session
+               end_verbs: Sequence = ('Logged Out',) # Verbs which end the current session
+              ) -> pd.DataFrame: # The statements sorted by actor and timestamp, with the session columns
+    """
+    Splits the statements of each actor into sessions. Adds the columns *session* with the id of the session,
+    *since_previous* with the time since the previous statement of the session and *previous_object* with its object
+    """
+    return Sessionizer(gap, start_verbs, end_verbs).process(df)
+
+# %% ../nbs/06_sessions.ipynb 13
+def session_summary(df: Union[pd.DataFrame, Iterable[pd.DataFrame]] # Sessionized statements, or an iterable of sessionized chunks
+                   ) -> pd.DataFrame: # A dataframe with one row per session
+    """
+    Computes the actor, start, end, duration and number of statements of each session
+    """
+    partials = [chunk.groupby('session').agg(actor=('actor', 'first'), start=('timestamp', 'min'),
+                                             end=('timestamp', 'max'), n_statements=('timestamp', 'size'))
+                for chunk in _iter_chunks(df)]
+    if not partials:
+        return pd.DataFrame(columns=['session', 'actor', 'start', 'end', 'duration', 'n_statements'])
+    summary = pd.concat(partials).groupby(level=0).agg(actor=('actor', 'first'), start=('start', 'min'),
+                                                       end=('end', 'max'), n_statements=('n_statements', 'sum'))
+    summary.insert(3, 'duration', summary['end'] - summary['start'])
+    return summary.reset_index()
+
+def time_on_task(df: Union[pd.DataFrame, Iterable[pd.DataFrame]] # Sessionized statements, or an iterable of sessionized chunks
+                ) -> pd.DataFrame: # A dataframe with the time spent by each actor on each object
+    """
+    Computes the total time spent by each actor on each object, sorted from the longest
+    """
+    totals = None
+    for chunk in _iter_chunks(df):
+        partial = chunk.groupby(['actor', 'previous_object'], observed=True)['since_previous'].sum()
+        totals = partial if totals is None else totals.add(partial, fill_value=pd.Timedelta(0))
+    if totals is None:
+        return pd.DataFrame(columns=['actor', 'object', 'time_on_task'])
+    totals = totals.rename('time_on_task').rename_axis(['actor', 'object']).sort_index()
+    return totals.reset_index().sort_values('time_on_task', ascending=False, kind='stable')
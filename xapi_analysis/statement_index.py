@@ -0,0 +1,67 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/04_statement_index.ipynb.
+
+# %% auto 0
+__all__ = ['StatementIndex']
+
+# %% ../nbs/04_statement_index.ipynb 4
+import numpy as np
+import pandas as pd
+from typing import List, Sequence
+
+# %% ../nbs/04_statement_index.ipynb 7
+def _group_positions(s: pd.Series # The column to index
+                    ) -> tuple: # The distinct values, the row codes, the sorted row positions and the offsets of each value
+    if isinstance(s.dtype, pd.CategoricalDtype):
+        codes, values = s.cat.codes.to_numpy(), s.cat.categories
+    else:
+        codes, values = pd.factorize(s)
+        values = pd.Index(values)
+    order = np.argsort(codes, kind='stable')
+    counts = np.bincount(codes[codes >= 0], minlength=len(values))
+    # missing values have code -1 and are sorted before all the others
+    offsets = np.concatenate([[0], np.cumsum(counts)]) + (codes < 0).sum()
+    return values, codes, order, offsets
+
+class StatementIndex:
+    "Row positions of a dataset grouped by the values of some columns, for fast lookups"
+    def __init__(self,
+                 df: pd.DataFrame, # The dataset containing the xAPI statements (one statement per row)
+                 cols: Sequence = ('actor', 'verb', 'object') # The columns to index
+                ):
+        self.labels, self.n_rows = df.index, len(df)
+        self.cols = [col for col in cols if col in df.columns]
+        self._groups = {col: _group_positions(df[col]) for col in self.cols}
+
+    def is_valid(self, df: pd.DataFrame) -> bool:
+        """
+        Whether the index was built on `df`. Filtered or reindexed copies of the dataset are not valid.
+        Changes to the values of the indexed columns are not detected: the index must be built again after them
+        """
+        return df.index is self.labels and len(df) == self.n_rows
+
+    def _col_positions(self, col: str, values: List) -> np.ndarray:
+        uniques, _, order, offsets = self._groups[col]
+        codes = uniques.get_indexer(values)
+        slices = [order[offsets[c]:offsets[c + 1]] for c in codes[codes >= 0]]
+        return np.concatenate(slices) if slices else np.empty(0, dtype=np.intp)
+
+    def positions(self, **values # A value or list of values for each of the indexed columns
+                 ) -> np.ndarray: # The sorted positions of the rows matching all the values
+        """
+        Returns the positions of the rows matching the values. The column with the fewest
+        matching rows is looked up first, and only those rows are checked against the other columns
+        """
+        wanted = {col: v if isinstance(v, (list, tuple, set, np.ndarray, pd.Index)) else [v] for col, v in values.items()}
+        candidates = {col: self._col_positions(col, list(v)) for col, v in wanted.items()}
+        first = min(candidates, key=lambda col: len(candidates[col]))
+        pos = candidates[first]
+        for col in wanted:
+            if col == first or len(pos) == 0: continue
+            uniques, codes, _, _ = self._groups[col]
+            # the unknown values and the missing values of the rows are both coded -1
+            wanted_codes = uniques.get_indexer(list(wanted[col]))
+            pos = pos[np.isin(codes[pos], wanted_codes[wanted_codes >= 0])]
+        return np.sort(pos)
+
+    def __repr__(self):
+        return f"StatementIndex(cols={self.cols}, n_rows={self.n_rows})"
@@ -0,0 +1,129 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/10_store.ipynb.
+
+# %% auto 0
+__all__ = ['StatementQuery', 'StatementStore']
+
+# %% ../nbs/10_store.ipynb 4
+import json
+import sqlite3
+import pandas as pd
+from pathlib import Path
+from typing import Union, List, Set, Iterable, Iterator
+from .input_csv import _iter_chunks, _count_result, _average_result, parse_timestamps
+
+# %% ../nbs/10_store.ipynb 7
+def _quote(name: str) -> str:
+    "Quotes a column or table name for SQL"
+    return '"' + name.replace('"', '""') + '"'
+
+class StatementQuery:
+    "A selection of the statements of a `StatementStore`, evaluated by the database"
+    def __init__(self, store: 'StatementStore', conditions: tuple = (), params: tuple = ()):
+        self.store, self.conditions, self.params = store, conditions, params
+
+    def _where(self, condition: str, *params) -> 'StatementQuery':
+        return StatementQuery(self.store, self.conditions + (condition,), self.params + params)
+
+    def _read(self, select: str, group_by: str = None, **kwargs) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+        sql = f"SELECT {select} FROM {_quote(self.store.table)}"
+        if self.conditions:
+            sql += " WHERE " + " AND ".join(f"({c})" for c in self.conditions)
+        if group_by is not None:
+            sql += f" GROUP BY {group_by}"
+        return pd.read_sql_query(sql, self.store.con, params=self.params, **kwargs)
+
+    def __len__(self) -> int:
+        return int(self._read("COUNT(*)").iat[0, 0])
+
+    def _unique_values(self, col: str) -> Set:
+        return set(self._read(f"DISTINCT {_quote(col)}")[col])
+
+    def get_all_verbs(self) -> Set:
+        "Like `input_csv.get_all_verbs`"
+        return self._unique_values('verb')
+
+    def get_all_actors(self) -> Set:
+        "Like `input_csv.get_all_actors`"
+        return self._unique_values('actor')
+
+    def get_all_objects(self) -> Set:
+        "Like `input_csv.get_all_objects`"
+        return self._unique_values('object')
+
+    def _remove_values(self, col: str, values: List) -> 'StatementQuery':
+        # the values are passed as a single json array, so there is no limit on their number
+        return self._where(f"{_quote(col)} IS NULL OR {_quote(col)} NOT IN (SELECT value FROM json_each(?))",
+                           json.dumps(list(values)))
+
+    def remove_actors(self, cols: List) -> 'StatementQuery':
+        "Like `input_csv.remove_actors`"
+        return self._remove_values('actor', cols)
+
+    def remove_verbs(self, cols: List) -> 'StatementQuery':
+        "Like `input_csv.remove_verbs`"
+        return self._remove_values('verb', cols)
+
+    def subset_actor_verb(self, actor: str, verb: str) -> 'StatementQuery':
+        "Like `input_csv.subset_actor_verb`"
+        return self._where('"actor" = ? AND "verb" = ?', actor, verb)
+
+    def count_interactions(self) -> pd.DataFrame:
+        "Like `input_csv.count_interactions`"
+        counts = self._where('"actor" IS NOT NULL')._read('"actor", COUNT("verb") AS "count"', group_by='"actor"')
+        return _count_result(counts.set_index('actor')['count'] if len(counts) else None)
+
+    def average_interactions(self, avg_col: str, user_col: str = 'actor') -> pd.DataFrame:
+        "Like `input_csv.average_interactions`"
+        user, avg = _quote(user_col), _quote(avg_col)
+        totals = self._where(f"{user} IS NOT NULL")._read(f'{user}, SUM({avg}) AS "sum", COUNT({avg}) AS "count"', group_by=user)
+        return _average_result(totals.set_index(user_col) if len(totals) else None, avg_col, user_col)
+
+    def _parse(self, df: pd.DataFrame) -> pd.DataFrame:
+        for col in ['timestamp', 'stored']:
+            if col in df.columns:
+                df[col] = parse_timestamps(df[col])
+        return df
+
+    def to_frame(self) -> pd.DataFrame:
+        "Loads the selected statements in memory"
+        return self._parse(self._read("*"))
+
+    def chunks(self, chunksize: int = 100_000 # The maximum number of statements in each chunk
+              ) -> Iterator[pd.DataFrame]:
+        "Loads the selected statements in chunks, with rows numbered consecutively across chunks"
+        start = 0
+        for chunk in self._read("*", chunksize=chunksize):
+            chunk.index = pd.RangeIndex(start, start + len(chunk))
+            start += len(chunk)
+            yield self._parse(chunk)
+
+# %% ../nbs/10_store.ipynb 9
+class StatementStore(StatementQuery):
+    "Statements stored in a SQLite database, queried without loading them in memory"
+    def __init__(self,
+                 path: Union[str, Path] = ':memory:', # The database file, created if it does not exist
+                 table: str = 'statements' # The table containing the statements
+                ):
+        self.con, self.table = sqlite3.connect(str(path)), table
+        super().__init__(self)
+
+    @property
+    def columns(self) -> List[str]:
+        "The columns of the stored statements"
+        return [row[1] for row in self.con.execute(f"PRAGMA table_info({_quote(self.table)})")]
+
+    def append(self, df: Union[pd.DataFrame, Iterable[pd.DataFrame]] # The statements to store, or an iterable of chunks
+              ) -> 'StatementStore':
+        "Adds the statements to the store"
+        with self.con:
+            for chunk in _iter_chunks(df):
+                chunk.to_sql(self.table, self.con, index=False, if_exists='append')
+            cols = [c for c in ['actor', 'verb'] if c in self.columns]
+            if cols:
+                self.con.execute(f"CREATE INDEX IF NOT EXISTS {_quote(self.table + '_' + '_'.join(cols))} "
+                                 f"ON {_quote(self.table)} ({', '.join(map(_quote, cols))})")
+        return self
+
+    def close(self):
+        "Closes the connection to the database"
+        self.con.close()
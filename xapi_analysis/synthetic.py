@@ -0,0 +1,157 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/12_synthetic.ipynb.
+
+# %% auto 0
+__all__ = ['default_verbs', 'csv_schemas', 'generate_statements', 'to_schema', 'write_statements']
+
+# %% ../nbs/12_synthetic.ipynb 4
+import hashlib
+import json
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import Union, List
+
+# %% ../nbs/12_synthetic.ipynb 6
+default_verbs = ['Selected', 'Logged In', 'Logged Out', 'Assigned', 'started', 'viewed', 'completed', 'answered',
+                 'launched', 'exit', 'Attempted', 'pause app', 'Return to app', 'experienced', 'interacted']
+
+def _zipf_choice(rng: np.random.Generator, n_values: int, size: int, skew: float) -> np.ndarray:
+    "Indices in `range(n_values)` drawn with probability proportional to `1 / rank ** skew`"
+    weights = 1.0 / np.arange(1, n_values + 1) ** skew
+    return rng.choice(n_values, size=size, p=weights / weights.sum())
+
+def _results(n_scores: int = 101) -> List:
+    "The distinct results of the statements: none, completion, success and scores"
+    return ([None, '{"completion":true}', '{"completion":false}', '{"success":true}', '{"success":false}'] +
+            [f'{{"success":{str(k >= 50).lower()},"score":{{"raw":{k}}}}}' for k in range(n_scores)])
+
+def generate_statements(n: int, # The number of statements
+                        n_actors: int = 1000, # The number of distinct actors
+                        n_verbs: int = 10, # The number of distinct verbs
+                        n_objects: int = 100, # The number of distinct objects
+                        skew: float = 1.1, # The exponent of the Zipf distribution of actors, verbs and objects (0 for uniform)
+                        start: str = '2023-01-01', # The date of the first statement
+                        duration: str = '30D', # The period covered by the statements
+                        seed: int = 0 # The seed of the random generator
+                       ) -> pd.DataFrame: # The statements, with the columns of `input_csv.import_csv`
+    """
+    Generates random statements, with the columns timestamp, stored, actor, verb, object and result
+    """
+    rng = np.random.default_rng(seed)
+    offsets = np.sort(rng.integers(0, pd.Timedelta(duration).value, n))
+    timestamp = pd.Timestamp(start, tz='UTC') + pd.to_timedelta(offsets // 1_000_000 * 1_000_000, unit='ns')
+    stored = timestamp + pd.to_timedelta(rng.exponential(0.5, n) * 1000, unit='ms').round('ms')
+    verbs = default_verbs[:n_verbs] + [f'verb {i}' for i in range(len(default_verbs), n_verbs)]
+    results = _results()
+    result_codes = rng.choice(len(results), size=n, p=[0.4] + [0.3 / 4] * 4 + [0.3 / (len(results) - 5)] * (len(results) - 5))
+    return pd.DataFrame({
+        'timestamp': timestamp,
+        'stored': stored,
+        'actor': pd.Categorical.from_codes(_zipf_choice(rng, n_actors, n, skew), [f'Student{i:06d}' for i in range(n_actors)]),
+        'verb': pd.Categorical.from_codes(_zipf_choice(rng, n_verbs, n, skew), verbs),
+        'object': pd.Categorical.from_codes(_zipf_choice(rng, n_objects, n, skew),
+                                            [f'course{i % 10};lesson{i}' for i in range(n_objects)]),
+        'result': np.asarray(results, dtype=object)[result_codes],
+    })
+
+# %% ../nbs/12_synthetic.ipynb 9
+csv_schemas = {
+    'example_1': dict(columns=['timestamp', 'lrs_id', 'actor name', 'verb id', 'verb display', 'object id', 'object name', 'result'],
+                      delimiter=';', lang='en-us', index=False, encoding='utf-8-sig', dates=dict(timestamp=('us', 'T', '0Z'))),
+    'example_2': dict(columns=['timestamp', 'lrs_id', 'actor name', 'verb id', 'verb display', 'object id', 'object name',
+                               'object description', 'result'],
+                      delimiter=',', lang='en-US', index=False, encoding='utf-8', dates=dict(timestamp=('ms', 'T', 'Z'))),
+    'example_3': dict(columns=['timestamp', 'lrs_id', 'actor', 'verb id', 'verb display', 'object id', 'object name', 'result', 'language'],
+                      delimiter=',', lang='en-US', index=False, encoding='utf-8', dates=dict(timestamp=('ms', 'T', 'Z'))),
+    'example_4': dict(columns=['timestamp', 'stored', 'actor', 'verb', 'object', 'result'],
+                      delimiter=',', lang='en-US', index=True, encoding='utf-8',
+                      dates=dict(timestamp=('us', ' ', '+00:00'), stored=('ms', 'T', 'Z'))),
+}
+
+_lrs_id, _client = '60ffcf8d448b2d059a63e3c3', '60ffcf8d448b2d059a63e3c4'
+
+def _format_dates(s: pd.Series, unit: str = 'ms', sep: str = 'T', suffix: str = 'Z') -> pd.Series:
+    "Formats UTC datetimes as ISO 8601 strings, all at once"
+    text = np.datetime_as_string(s.dt.tz_convert(None).to_numpy(f'datetime64[{unit}]'), unit=unit)
+    return (pd.Series(text, index=s.index, dtype=object).str.replace('T', sep, regex=False) + suffix)
+
+def _map_names(s: pd.Series, f) -> np.ndarray:
+    "Applies `f` to each distinct value of a categorical column, and maps the results back to all the rows"
+    return np.asarray([f(c) for c in s.cat.categories] + [None], dtype=object)[s.cat.codes.to_numpy()]
+
+def to_schema(df: pd.DataFrame, # Statements generated by `generate_statements`
+              schema: str = 'example_2' # The name of the format in `csv_schemas`
+             ) -> pd.DataFrame: # The statements with the columns of the format, as they appear in the csv file
+    """
+    Converts the statements to the columns of one of the example csv files
+    """
+    spec = csv_schemas[schema]
+    lang_map = lambda text: repr({spec['lang']: text})
+    builders = {
+        'lrs_id': lambda: _lrs_id,
+        'actor name': lambda: df['actor'], 'actor': lambda: df['actor'],
+        'verb': lambda: df['verb'], 'object': lambda: df['object'],
+        'verb id': lambda: _map_names(df['verb'], lambda v: 'http://example.com/verbs/' + v.replace(' ', '-')),
+        'verb display': lambda: _map_names(df['verb'], lang_map),
+        'object id': lambda: _map_names(df['object'], lambda o: 'http://example.com/activities/' + o),
+        'object name': lambda: _map_names(df['object'], lang_map),
+        'object description': lambda: _map_names(df['object'], lambda o: lang_map('Description of ' + o)),
+        'result': lambda: df['result'],
+        'language': lambda: 'English',
+    }
+    out = pd.DataFrame(index=df.index)
+    for col in spec['columns']:
+        out[col] = _format_dates(df[col], *spec['dates'][col]) if col in spec['dates'] else builders[col]()
+    return out
+
+# %% ../nbs/12_synthetic.ipynb 11
+def _json_statements(df: pd.DataFrame, wrapped: bool = True, lang: str = 'en-US'):
+    "Generates the statements as dictionaries, in the format of Learning Locker or of the xAPI"
+    dates = {col: _format_dates(df[col]).tolist() for col in ['timestamp', 'stored']}
+    verb_ids = _map_names(df['verb'], lambda v: 'http://example.com/verbs/' + v.replace(' ', '-'))
+    object_ids = _map_names(df['object'], lambda o: 'http://example.com/activities/' + o)
+    codes, uniques = pd.factorize(df['result'])
+    results = [json.loads(r) for r in uniques] + [None]
+    for i, (actor, verb, obj) in enumerate(zip(df['actor'].tolist(), df['verb'].tolist(), df['object'].tolist())):
+        statement_id = f'{hashlib.md5(str(i).encode()).hexdigest()}'
+        statement = {'id': statement_id, 'timestamp': dates['timestamp'][i], 'stored': dates['stored'][i], 'version': '1.0.3',
+                     'actor': {'objectType': 'Agent', 'name': actor, 'mbox': f'mailto:{actor.lower()}@example.com'},
+                     'verb': {'id': verb_ids[i], 'display': {lang: verb}},
+                     'object': {'objectType': 'Activity', 'id': object_ids[i],
+                                'definition': {'name': {lang: obj}, 'description': {lang: 'Description of ' + obj}}}}
+        if results[codes[i]] is not None:
+            statement['result'] = results[codes[i]]
+        if not wrapped:
+            yield statement
+            continue
+        yield {'_id': statement_id[:24], 'hash': hashlib.sha1(statement_id.encode()).hexdigest(),
+               'timestamp': dates['timestamp'][i], 'stored': dates['stored'][i], 'lrs_id': _lrs_id, 'client': _client,
+               'active': True, 'voided': False, 'statement': statement,
+               'completedQueues': ['STATEMENT_FORWARDING_QUEUE', 'STATEMENT_PERSON_QUEUE', 'STATEMENT_QUERYBUILDERCACHE_QUEUE'],
+               'completedForwardingQueue': [], 'failedForwardingLog': [], 'deadForwardingQueue': [],
+               'pendingForwardingQueue': [], 'processingQueues': []}
+
+def write_statements(df: pd.DataFrame, # Statements generated by `generate_statements`
+                     path: Union[str, Path], # The file to write
+                     format: str = 'csv', # One of `csv`, `ndjson` and `json`
+                     schema: str = 'example_2', # The name of the format in `csv_schemas`, for `csv` files
+                     wrapped: bool = True # For json files, whether the statements are wrapped with the metadata of the LRS
+                    ) -> Path: # The file written
+    """
+    Writes the statements to a csv, newline-delimited json or json file
+    """
+    path = Path(path)
+    if format == 'csv':
+        spec = csv_schemas[schema]
+        to_schema(df, schema).to_csv(path, sep=spec['delimiter'], index=spec['index'], encoding=spec['encoding'])
+    elif format in ('ndjson', 'json'):
+        with open(path, 'w') as f:
+            if format == 'json': f.write('[\n')
+            for i, statement in enumerate(_json_statements(df, wrapped)):
+                if i and format == 'json': f.write(',\n')
+                f.write(json.dumps(statement))
+                if format == 'ndjson': f.write('\n')
+            if format == 'json': f.write('\n]\n')
+    else:
+        raise ValueError(f"Unknown format: {format}")
+    return path